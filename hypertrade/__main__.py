@@ -1,33 +1,57 @@
 """Module entrypoint: ``python -m hypertrade`` starts the daemon via uvicorn.
 
-Importing :mod:`hypertrade.daemon` eagerly builds and validates the app — on
-missing configuration it prints the startup banner and exits non-zero, exactly
-like ``uvicorn hypertrade.daemon:app``. When config is valid, uvicorn serves the
+Importing ``app`` from :mod:`hypertrade.daemon` builds and validates it — on missing
+configuration it prints the startup banner and exits non-zero, exactly like
+``uvicorn hypertrade.daemon:app``. The import happens inside :func:`main` and
+only where the app object is served in-process: with reload on, uvicorn imports
+it by string in the reloader's child instead. When config is valid, uvicorn serves the
 app on the configured host/port (``HYPERTRADE_LISTEN_HOST`` /
-``HYPERTRADE_LISTEN_PORT``, defaulting to ``0.0.0.0:6487``).
+``HYPERTRADE_LISTEN_PORT``, defaulting to ``0.0.0.0:6487``) on a single worker
+with uvloop + httptools, matching the production launch scripts. Auto-reload is
+off unless ``HYPERTRADE_RELOAD=true`` (development only).
 """
 
 import uvicorn
+from pydantic import ValidationError
 
 from .config import get_settings
-from .daemon import app
 
 # Fallback when HYPERTRADE_LISTEN_PORT is unset (Settings.listen_port is None).
 DEFAULT_PORT = 6487
 # Levels uvicorn accepts for its own logging config; anything else falls back.
 _UVICORN_LOG_LEVELS = {"critical", "error", "warning", "info", "debug", "trace"}
+# Runtime artefacts the reloader must not watch, or every order write restarts it.
+_RELOAD_EXCLUDES = ["*.db", "*.db-*", "*.log"]
 
 
 def main() -> None:
     """Serve the Hypertrade daemon with uvicorn on the configured host/port."""
-    settings = get_settings()
+    # pylint: disable=import-outside-toplevel
+    try:
+        settings = get_settings()
+    except ValidationError:
+        # Building the app prints the missing-configuration banner and exits.
+        from .daemon import app  # noqa: F401  pylint: disable=unused-import
+        raise
     level = settings.log_level.lower()
-    uvicorn.run(
-        app,
-        host=settings.listen_host,
-        port=settings.listen_port or DEFAULT_PORT,
-        log_level=level if level in _UVICORN_LOG_LEVELS else "info",
-    )
+    options = {
+        "host": settings.listen_host,
+        "port": settings.listen_port or DEFAULT_PORT,
+        "log_level": level if level in _UVICORN_LOG_LEVELS else "info",
+        # Both ship with uvicorn[standard] (a hard dependency).
+        "loop": "uvloop",
+        "http": "httptools",
+    }
+    if settings.reload:
+        # The reloader re-imports the app in a child process, so it needs the import string.
+        uvicorn.run(
+            "hypertrade.daemon:app", reload=True, reload_excludes=_RELOAD_EXCLUDES, **options
+        )
+    else:
+        # Serve the already-built app object: no second import via the string.
+        from .daemon import app
+
+        uvicorn.run(app, **options)
 
 
 if __name__ == "__main__":
@@ -1,19 +1,62 @@
 """Application configuration using Pydantic BaseSettings."""
 
 from functools import lru_cache
-from typing import List, Optional
-from pydantic import SecretStr, field_validator, model_validator
+from typing import Annotated, List, Literal, Optional, get_args
+from pydantic import (
+    AfterValidator,
+    BeforeValidator,
+    Field,
+    SecretStr,
+    StringConstraints,
+    model_validator,
+)
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Hyperliquid REST endpoint per HYPERTRADE_ENVIRONMENT.
+_API_URLS = {
+    "prod": "https://api.hyperliquid.xyz",
+    "test": "https://api.hyperliquid-testnet.xyz",
+}
+
+LogLevel = Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"]
+# Case-folded name -> canonical level, so normalization is a single dict probe.
+_LOG_LEVELS = {level.lower(): level for level in get_args(LogLevel)}
+
+
+def _normalize_environment(value: object) -> str:
+    return str(value or "").strip().lower()
+
+
+def _normalize_level(value: object) -> str:
+    """Canonicalize the level name; unknown levels fall back to INFO instead of failing."""
+    return _LOG_LEVELS.get(str(value or "").strip().lower(), "INFO")
+
+
+def _secret_not_blank(secret: SecretStr) -> SecretStr:
+    if not secret or not secret.get_secret_value().strip():
+        raise ValueError("must be set and non-empty")
+    return secret
+
+
+# Field types carry their own validation so pydantic-core runs constraint and
+# Literal checks natively; only the normalizers above stay Python callbacks.
+HyperliquidEnvironment = Annotated[Literal["prod", "test"], BeforeValidator(_normalize_environment)]
+NonBlankStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+NonBlankSecret = Annotated[SecretStr, AfterValidator(_secret_not_blank)]
+NormalizedLogLevel = Annotated[LogLevel, BeforeValidator(_normalize_level)]
+
 
 class Settings(BaseSettings):
     """Runtime settings loaded from env/.env with validation."""
 
     # ── Core ─────────────────────────────────────
     app_environment: str = "local"
-    environment: str  # REQUIRED: must be "prod" or "test" (Hyperliquid API endpoint)
+    environment: HyperliquidEnvironment  # REQUIRED: must be "prod" or "test" (Hyperliquid API endpoint)
     listen_host: str = "0.0.0.0"
     listen_port: Optional[int] = None
+    # Dev-only: auto-reload on code changes when started via `python -m hypertrade`.
+    # Spawns a file-watcher supervisor, so leave it off in production.
+    reload: bool = False
 
     model_config = SettingsConfigDict(
         env_prefix="HYPERTRADE_",
@@ -21,27 +64,26 @@ class Settings(BaseSettings):
         case_sensitive=False,
         extra="ignore",
         validate_default=False,
+        # Settings are read-only once loaded (get_settings caches one instance).
+        frozen=True,
     )
 
     # ── REQUIRED SECRETS (will crash on import if missing) ─────────────────────
-    master_addr: str
-    api_wallet_priv: SecretStr
+    master_addr: NonBlankStr
+    api_wallet_priv: NonBlankSecret
     subaccount_addr: Optional[str] = None  # allowing None to enable trading on master account
 
     # ── Security & Networking ─────────────────────────────────────────────────
     @property
     def api_url(self) -> str:
-        """Derive api_url from HYPERTRADE_ENVIRONMENT."""
-        if self.environment == "prod":
-            return "https://api.hyperliquid.xyz"
-        elif self.environment == "test":
-            return "https://api.hyperliquid-testnet.xyz"
-        else:
-            raise ValueError(
-                f"Invalid HYPERTRADE_ENVIRONMENT='{self.environment}'. "
-                "Must be 'prod' or 'test'."
-            )
-            
+        """Derive api_url from HYPERTRADE_ENVIRONMENT.
+
+        ``environment`` is already validated to ``prod``/``test``, so this is a
+        single dict lookup. It is deliberately not cached: a cached value would
+        survive ``model_copy`` and report the old environment's URL.
+        """
+        return _API_URLS[self.environment]
+
     ip_whitelist_enabled: bool = False
     # Secure default: do not trust X-Forwarded-For (it is client-spoofable).
     # Enable only when behind a trusted reverse proxy; see hypertrade/security.py.
@@ -60,15 +102,19 @@ class Settings(BaseSettings):
     ]
 
     # Logging level
-    log_level: str = "INFO"
+    log_level: NormalizedLogLevel = "INFO"
 
     # Reduce noisy logs from random scanners
     suppress_404_logs: bool = True
+    # Log only every Nth successful (< 400) request line; errors are always
+    # logged. 1 logs every request.
+    access_log_sample_every: Annotated[int, Field(ge=1)] = 1
 
     # Rate limiting (basic in-memory, per-IP)
     rate_limit_enabled: bool = True
-    rate_limit_window_seconds: int = 60
-    rate_limit_max_requests: int = 120
+    # Both feed the token-bucket refill rate, so neither may be zero.
+    rate_limit_window_seconds: Annotated[int, Field(ge=1)] = 60
+    rate_limit_max_requests: Annotated[int, Field(ge=1)] = 120
     rate_limit_burst: int = 30
     rate_limit_only_paths: List[str] = []
     rate_limit_exclude_paths: List[str] = ["/health"]
@@ -76,15 +122,16 @@ class Settings(BaseSettings):
     # MARKET-order slippage cap (basis points OFF MID) for the marketable IOC:
     # BUY at mid*(1 + x), SELL at mid*(1 - x). This is a WORST-CASE bound — the IOC
     # still fills at the best available price inside it — so it is set generous enough
-    # to always cross the spread (HL's own market default is ~5%). Validator caps at 500.
+    # to always cross the spread (HL's own market default is ~5%). Bounded to 1-500 bps.
     # Lower it (env HYPERTRADE_MARKET_ORDER_PREMIUM_BPS) for tighter slippage control.
-    market_order_premium_bps: int = 500
+    market_order_premium_bps: Annotated[int, Field(ge=1, le=500)] = 500
 
     # Optional webhook secret; if set, incoming payloads must include
     # `general.secret` matching this value
     webhook_secret: Optional[SecretStr] = None
 
-    # Hardening & limits
+    # Hardening & limits. max_payload_bytes <= 0 disables the Content-Length
+    # limit entirely (its middleware is then not installed).
     max_payload_bytes: int = 65536
     enable_trusted_hosts: bool = False
     trusted_hosts: List[str] = ["*"]
@@ -99,7 +146,8 @@ class Settings(BaseSettings):
     db_enabled: bool = True
 
     # Cap orders/failures history tables to the most recent N rows (trim-on-insert)
-    max_history_rows: int = 200
+    # Must keep at least one row; <= 0 would delete everything on insert.
+    max_history_rows: Annotated[int, Field(ge=1)] = 200
 
     # Idempotency (at-most-once order placement keyed on general.nonce)
     idempotency_enabled: bool = True
@@ -107,68 +155,13 @@ class Settings(BaseSettings):
     # Sweep completed nonces older than this so the dedup index stays bounded.
     # A completed nonce only needs to outlive retries (seconds/minutes); 7 days
     # is a generous safety margin. Must be >= 60s to never race the in-flight window.
-    idempotency_retention_seconds: int = 604800  # 7 days
+    idempotency_retention_seconds: Annotated[int, Field(ge=60)] = 604800  # 7 days
 
     # Dry-run / demo: accept and fully validate webhooks but never place orders,
     # write to the DB, or touch the idempotency store.
     dry_run: bool = False
 
     # ── Validators ────────────────────────────────────────────────────────────
-    @field_validator("environment")
-    @classmethod
-    def _validate_hyperliquid_environment(cls, value: str) -> str:
-        value = (value or "").strip().lower()
-        if value not in {"prod", "test"}:
-            raise ValueError("must be 'prod' or 'test'")
-        return value
-
-    @field_validator("master_addr")
-    @classmethod
-    def _not_blank(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("must be set and non-empty")
-        return value
-
-    @field_validator("api_wallet_priv")
-    @classmethod
-    def _secret_not_blank(cls, secret: SecretStr) -> SecretStr:
-        if not secret or not secret.get_secret_value().strip():
-            raise ValueError("must be set and non-empty")
-        return secret
-
-    @field_validator("log_level")
-    @classmethod
-    def _normalize_level(cls, value: str) -> str:
-        level = (value or "").strip().upper()
-        valid = {"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"}
-        return level if level in valid else "INFO"
-
-    @field_validator("market_order_premium_bps")
-    @classmethod
-    def _validate_premium_bps(cls, value: int) -> int:
-        """Ensure premium is within reasonable range (1-500 bps)."""
-        if value < 1:
-            raise ValueError("market_order_premium_bps must be at least 1 bps")
-        if value > 500:
-            raise ValueError("market_order_premium_bps must not exceed 500 bps (5%)")
-        return value
-
-    @field_validator("max_history_rows")
-    @classmethod
-    def _validate_max_history_rows(cls, value: int) -> int:
-        """Must keep at least one row; <= 0 would delete everything on insert."""
-        if value < 1:
-            raise ValueError("max_history_rows must be at least 1")
-        return value
-
-    @field_validator("idempotency_retention_seconds")
-    @classmethod
-    def _validate_idempotency_retention_seconds(cls, value: int) -> int:
-        """Keep completed nonces long enough to dedupe retries safely."""
-        if value < 60:
-            raise ValueError("idempotency_retention_seconds must be at least 60")
-        return value
-
     @model_validator(mode="after")
     def _validate_webhook_authentication(self):
         """Ensure at least one authentication method is enabled for webhook endpoint.
@@ -202,7 +195,9 @@ class Settings(BaseSettings):
 # Cached settings instance
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Return a cached Settings instance (validates env on first call)."""
-    settings = Settings()
-    # Force validation of all required fields immediately by copying.
-    return settings.model_copy(update=settings.model_dump())
+    """Return a cached Settings instance (validates env on first call).
+
+    ``Settings()`` is the validation point: required fields are checked on
+    instantiation, so no extra copy/dump pass is needed to fail fast.
+    """
+    return Settings()
@@ -1,4 +1,18 @@
-"""ASGI app factory and configuration for the Hypertrade daemon."""
+"""ASGI app factory and configuration for the Hypertrade daemon.
+
+Only the settings layer is imported at module load. FastAPI, the middleware,
+routers and the DB layer are imported inside :func:`create_daemon` once the
+configuration has validated, so a misconfigured start fails fast without
+paying for the web stack.
+
+Serve it with the C event loop and HTTP parser from ``uvicorn[standard]``::
+
+    uvicorn hypertrade.daemon:app --workers 1 --loop uvloop --http httptools
+
+``python -m hypertrade`` and the production launch scripts already do.
+"""
+
+from __future__ import annotations
 
 import logging
 import multiprocessing
@@ -6,53 +20,50 @@ import os
 import signal
 import sys
 from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
-from fastapi import FastAPI
 from pydantic import ValidationError
-from starlette.middleware.trustedhost import TrustedHostMiddleware
 
 from .config import get_settings
-from .logging import log_startup_banner, log_endpoints, configure_logging
-from .middleware.logging import LoggingMiddleware
-from .middleware.content_limit import ContentLengthLimitMiddleware
-from .middleware.rate_limit import RateLimitMiddleware
-from .routes.health import router as health_router
-from .routes.webhooks import router as webhooks_router, history_router
-from .exception_handlers import register_exception_handlers
-from .database import OrderDatabase
 from .version import __version__
 
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
 log = logging.getLogger("uvicorn.error")
 
+# Printed when required configuration is missing. A module constant (not a
+# docstring), so it survives any docstring stripping and is built once.
+_MISSING_CONFIG_BANNER = (
+    "\n"
+    "╔" + "═" * 72 + "╗\n"
+    "║  ⚠️   HYPERTRADE DAEMON CANNOT START – MISSING CONFIGURATION   ⚠️        ║\n"
+    "╚" + "═" * 72 + "╝\n"
+    "\n"
+    "Required environment variables are not set:\n"
+    "\n"
+    "    • HYPERTRADE_ENVIRONMENT      → 'prod' or 'test' (Hyperliquid endpoint)\n"
+    "    • HYPERTRADE_MASTER_ADDR      → your Hyperliquid master address\n"
+    "    • HYPERTRADE_API_WALLET_PRIV  → 64-char hex private key (with or without 0x)\n"
+    "    • HYPERTRADE_SUBACCOUNT_ADDR  → your sub-account address (optional)\n"
+    "\n"
+    "Required authentication (at least one):\n"
+    "\n"
+    "    • HYPERTRADE_WEBHOOK_SECRET   → shared secret for webhook authentication\n"
+    "      OR\n"
+    "    • HYPERTRADE_IP_WHITELIST_ENABLED=true → enable IP whitelist authentication\n"
+    "\n\n"
+
+    "The daemon will start automatically once these are set.\n"
+    "\n"
+    "Tip: run  python -m hypertrade.setup  for a guided, interactive setup.\n"
+)
+
+
 def _please_die_gracefully() -> None:
     """Log a clear error message and exit if required secrets are missing."""
 
-    banner = (
-        "\n"
-        "╔" + "═" * 72 + "╗\n"
-        "║  ⚠️   HYPERTRADE DAEMON CANNOT START – MISSING CONFIGURATION   ⚠️        ║\n"
-        "╚" + "═" * 72 + "╝\n"
-        "\n"
-        "Required environment variables are not set:\n"
-        "\n"
-        "    • HYPERTRADE_ENVIRONMENT      → 'prod' or 'test' (Hyperliquid endpoint)\n"
-        "    • HYPERTRADE_MASTER_ADDR      → your Hyperliquid master address\n"
-        "    • HYPERTRADE_API_WALLET_PRIV  → 64-char hex private key (with or without 0x)\n"
-        "    • HYPERTRADE_SUBACCOUNT_ADDR  → your sub-account address (optional)\n"
-        "\n"
-        "Required authentication (at least one):\n"
-        "\n"
-        "    • HYPERTRADE_WEBHOOK_SECRET   → shared secret for webhook authentication\n"
-        "      OR\n"
-        "    • HYPERTRADE_IP_WHITELIST_ENABLED=true → enable IP whitelist authentication\n"
-        "\n\n"
-
-        "The daemon will start automatically once these are set.\n"
-        "\n"
-        "Tip: run  python -m hypertrade.setup  for a guided, interactive setup.\n"
-    )
-
-    log.info(banner)
+    log.info(_MISSING_CONFIG_BANNER)
     log.critical("Hypertrade startup aborted: missing required configuration")
     _stop_parent_supervisor()
     sys.exit(1)
@@ -81,8 +92,13 @@ def _stop_parent_supervisor() -> None:
 async def lifespan(app: FastAPI):
     """Manage app startup and shutdown events."""
     
-    # Startup: Log that the daemon is ready
-    settings = get_settings()
+    # pylint: disable=import-outside-toplevel
+    from .logging import start_log_queue, stop_log_queue
+
+    # Startup: uvicorn has configured its handlers by now; move their I/O off
+    # the request path, then log that the daemon is ready.
+    log_listeners = start_log_queue()
+    settings = app.state.settings
     
     log.info("Hypertrade Daemon is ready to accept requests on: '%s'",
         settings.subaccount_addr or "MASTER ACCOUNT")
@@ -94,31 +110,111 @@ async def lifespan(app: FastAPI):
     else:
         log.info("Trading restricted to subaccount: %s", settings.subaccount_addr)
 
-    yield
-
-    # Shutdown: Log that the daemon is shutting down
-    log.info("Hypertrade Daemon is shutting down.")
+    try:
+        yield
+    finally:
+        # Shutdown: Log that the daemon is shutting down, close the order DB's
+        # shared connection (checkpointing its WAL), then flush the log queues
+        log.info("Hypertrade Daemon is shutting down.")
+        try:
+            db = getattr(app.state, "db", None)
+            if db is not None:
+                db.close()
+        finally:
+            # Always drain the queues and restore uvicorn's handlers, even if
+            # the close (WAL checkpoint) fails on a locked or full disk.
+            stop_log_queue(log_listeners)
 
 
 def create_daemon() -> FastAPI:
     """Create and configure the FastAPI app."""
 
-    # Create app first so we can attach settings or fail cleanly
-    app = FastAPI(title="Hypertrade Daemon", version=__version__, lifespan=lifespan)
-
-    # Load settings and configure logging; provide clear error if env missing
+    # Load settings first; provide clear error if env missing
     try:
         settings = get_settings()
     except ValidationError:
         _please_die_gracefully()
 
+    # pylint: disable=import-outside-toplevel
+    # Heavy imports are deferred until the config is known to be valid.
+    from fastapi import FastAPI
+    from starlette.middleware import Middleware
+    from starlette.middleware.trustedhost import TrustedHostMiddleware
+
+    from .database import OrderDatabase
+    from .exception_handlers import register_exception_handlers
+    from .logging import log_startup_banner, log_endpoints, configure_logging
+    from .middleware.content_limit import ContentLengthLimitMiddleware
+    from .middleware.logging import LoggingMiddleware
+    from .middleware.rate_limit import RateLimitMiddleware
+    from .routes.health import router as health_router
+    from .routes.webhooks import router as webhooks_router, history_router
+
     # Configure logging based on settings
     configure_logging(settings.log_level)
 
+    # Compile the per-request lookup sets once; the whitelist dependency and
+    # the rate limiter do O(1) membership checks against these.
+    tv_webhook_ips = frozenset(settings.tv_webhook_ips or ())
+
+    # The middleware stack, outermost first, handed to FastAPI in one go.
+    # Disabled middleware is not added at all, so it costs no per-request hop.
+    middleware = []
+    if settings.enable_trusted_hosts and settings.trusted_hosts:
+        middleware.append(
+            Middleware(TrustedHostMiddleware, allowed_hosts=settings.trusted_hosts)
+        )
+    if settings.rate_limit_enabled:
+        middleware.append(
+            Middleware(
+                RateLimitMiddleware,
+                max_requests=settings.rate_limit_max_requests,
+                window_seconds=settings.rate_limit_window_seconds,
+                burst=settings.rate_limit_burst,
+                trust_forwarded_for=settings.trust_forwarded_for,
+                only_paths=frozenset(settings.rate_limit_only_paths),
+                exclude_paths=frozenset(settings.rate_limit_exclude_paths),
+                whitelist_ips=tv_webhook_ips if settings.ip_whitelist_enabled else frozenset(),
+            )
+        )
+    if settings.max_payload_bytes > 0:
+        middleware.append(
+            Middleware(ContentLengthLimitMiddleware, max_bytes=settings.max_payload_bytes)
+        )
+    # LoggingMiddleware is always on: it mints the request_id that seeds the
+    # cloid and keys the order history, not just the access log line.
+    middleware.append(
+        Middleware(
+            LoggingMiddleware,
+            trust_forwarded_for=settings.trust_forwarded_for,
+            suppress_404_logs=settings.suppress_404_logs,
+            sample_every=settings.access_log_sample_every,
+        )
+    )
+
+    # Interactive docs are a development aid: on mainnet the OpenAPI schema is
+    # never built or served. ReDoc duplicates /docs, so it is always off.
+    docs_enabled = settings.environment != "prod"
+    app = FastAPI(
+        title="Hypertrade Daemon",
+        version=__version__,
+        lifespan=lifespan,
+        middleware=middleware,
+        openapi_url="/openapi.json" if docs_enabled else None,
+        docs_url="/docs" if docs_enabled else None,
+        redoc_url=None,
+    )
     app.state.settings = settings
+    app.state.tv_webhook_ips = tv_webhook_ips
+    # Expected Bearer token as bytes, unwrapped once for require_bearer_secret.
+    app.state.bearer_secret = (
+        settings.webhook_secret.get_secret_value().encode()
+        if settings.webhook_secret
+        else None
+    )
 
     # Initialize database if enabled
-    if getattr(settings, "db_enabled", True):
+    if settings.db_enabled:
         try:
             db = OrderDatabase(settings.db_path, max_rows=settings.max_history_rows)
             app.state.db = db
@@ -143,47 +239,31 @@ def create_daemon() -> FastAPI:
         app.state.idempotency = None
         log.info("Idempotency disabled")
 
-    # Finalize logging with configured level and add middleware
-    app.add_middleware(LoggingMiddleware)
-    app.add_middleware(
-        ContentLengthLimitMiddleware, max_bytes=settings.max_payload_bytes
-    )
-    if settings.rate_limit_enabled:
-        whitelist = settings.tv_webhook_ips if settings.ip_whitelist_enabled else []
-        app.add_middleware(
-            RateLimitMiddleware,
-            max_requests=settings.rate_limit_max_requests,
-            window_seconds=settings.rate_limit_window_seconds,
-            burst=settings.rate_limit_burst,
-            trust_forwarded_for=settings.trust_forwarded_for,
-            only_paths=settings.rate_limit_only_paths,
-            exclude_paths=settings.rate_limit_exclude_paths,
-            whitelist_ips=whitelist,
-        )
-    if settings.enable_trusted_hosts and settings.trusted_hosts:
-        app.add_middleware(
-            TrustedHostMiddleware, allowed_hosts=settings.trusted_hosts
-        )
     register_exception_handlers(app)
-    log.info(
-        "App started app_env=%s hl_env=%s whitelist_enabled=%s log_level=%s",
-        settings.app_environment,
-        settings.environment,
-        settings.ip_whitelist_enabled,
-        settings.log_level,
-    )
-    log.info("Loaded %d TV webhook IPs", len(settings.tv_webhook_ips or []))
 
-    # Log Hyperliquid environment and endpoint
-    log.info(
-        "Hyperliquid API: environment=%s endpoint=%s",
-        settings.environment.upper(),
-        settings.api_url,
-    )
+    # The startup summary is INFO-only; skip building it entirely when the
+    # configured level filters INFO out. The banner and endpoint table helpers
+    # carry the same guard themselves.
+    if log.isEnabledFor(logging.INFO):
+        log.info(
+            "App started app_env=%s hl_env=%s whitelist_enabled=%s log_level=%s",
+            settings.app_environment,
+            settings.environment,
+            settings.ip_whitelist_enabled,
+            settings.log_level,
+        )
+        log.info("Loaded %d TV webhook IPs", len(app.state.tv_webhook_ips))
 
-    # Log webhook secret status
-    webhook_secret_status = "ENABLED" if settings.webhook_secret else "DISABLED"
-    log.info("Webhook secret: %s", webhook_secret_status)
+        # Log Hyperliquid environment and endpoint
+        log.info(
+            "Hyperliquid API: environment=%s endpoint=%s",
+            settings.environment.upper(),
+            settings.api_url,
+        )
+
+        # Log webhook secret status
+        webhook_secret_status = "ENABLED" if settings.webhook_secret else "DISABLED"
+        log.info("Webhook secret: %s", webhook_secret_status)
 
     # Showing our startup banner
     log_startup_banner(
@@ -203,6 +283,14 @@ def create_daemon() -> FastAPI:
     # Log endpoints after routes are registered
     log_endpoints(app)
 
+    # Build the OpenAPI schema now (FastAPI caches it on the app) so the first
+    # /docs or /openapi.json hit doesn't pay for walking every route model.
+    if docs_enabled:
+        try:
+            app.openapi()
+        except Exception as e:  # pylint: disable=broad-except
+            log.warning("OpenAPI prebuild failed: %s", e)
+
     if settings.dry_run:
         log.warning(
             "⚠️  DRY-RUN MODE ENABLED — webhooks are validated but NO orders are "
@@ -212,5 +300,14 @@ def create_daemon() -> FastAPI:
     return app
 
 
-# Expose ASGI app for uvicorn
-app = create_daemon()
+def __getattr__(name: str):
+    """Build the ASGI ``app`` on first access (PEP 562), not at import.
+
+    ``uvicorn hypertrade.daemon:app`` and ``from hypertrade.daemon import app``
+    still get a ready app, but importing the module for :func:`create_daemon`
+    (tests, CLI helpers) no longer builds one as a side effect.
+    """
+    if name == "app":
+        app = globals()["app"] = create_daemon()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,18 +3,105 @@
 import os
 import sqlite3
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Iterator, Optional, List, Dict, Any, Union
 
 from hypertrade import sqlite_util
 
 log = logging.getLogger("uvicorn.error")
 
+# Whole schema in one script and one transaction: DDL does not open an
+# implicit transaction in sqlite3, so separate execute() calls would each
+# autocommit (and sync) on their own.
+_SCHEMA_SQL = """
+BEGIN;
+
+-- Orders table: tracks all executed orders (successful and failed)
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    request_id TEXT UNIQUE,
+    timestamp TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    side TEXT NOT NULL,
+    signal TEXT NOT NULL,
+    quantity REAL NOT NULL,
+    price REAL NOT NULL,
+    leverage INTEGER,
+    subaccount TEXT,
+    status TEXT NOT NULL,
+    order_id TEXT,
+    avg_price REAL,
+    total_size REAL,
+    response_json TEXT,
+    execution_ms REAL
+);
+
+-- Failures table: detailed failure information
+CREATE TABLE IF NOT EXISTS failures (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    order_id INTEGER,
+    request_id TEXT,
+    timestamp TEXT NOT NULL,
+    error_type TEXT NOT NULL,
+    error_message TEXT NOT NULL,
+    attempt INTEGER NOT NULL,
+    retry_count INTEGER DEFAULT 0,
+    FOREIGN KEY (order_id) REFERENCES orders(id)
+);
+
+-- Indices for faster queries
+CREATE INDEX IF NOT EXISTS idx_orders_symbol ON orders(symbol);
+CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status);
+CREATE INDEX IF NOT EXISTS idx_orders_request_id ON orders(request_id);
+CREATE INDEX IF NOT EXISTS idx_failures_order_id ON failures(order_id);
+
+-- History is read newest-first by the INTEGER primary key (insert order),
+-- so the TEXT timestamp indexes only cost a write each; drop old copies.
+DROP INDEX IF EXISTS idx_orders_timestamp;
+DROP INDEX IF EXISTS idx_failures_timestamp;
+
+COMMIT;
+"""
+
+# Hot-path statements as fixed strings: sqlite3's per-connection statement
+# cache is keyed by SQL text, so on the shared connection each is prepared once.
+_INSERT_ORDER_SQL = (
+    "INSERT INTO orders (request_id, timestamp, symbol, side, signal, quantity, price, "
+    "leverage, subaccount, status, order_id, avg_price, total_size, response_json, "
+    "execution_ms) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_TRIM_ORDERS_SQL = (
+    "DELETE FROM orders WHERE id NOT IN (SELECT id FROM orders ORDER BY id DESC LIMIT ?)"
+)
+_INSERT_FAILURE_SQL = (
+    "INSERT INTO failures (order_id, request_id, timestamp, error_type, error_message, "
+    "attempt, retry_count) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_TRIM_FAILURES_SQL = (
+    "DELETE FROM failures WHERE id NOT IN (SELECT id FROM failures ORDER BY id DESC LIMIT ?)"
+)
+
+
+def _fetch_dicts(
+    conn: sqlite3.Connection, query: str, params: Union[tuple, List[Any]] = ()
+) -> List[Dict[str, Any]]:
+    """Run a query and build result dicts in one pass over plain tuples."""
+    cursor = conn.execute(query, params)
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
 
 class OrderDatabase:
-    """SQLite database for storing order operations and failures."""
+    """SQLite database for storing order operations and failures.
+
+    All reads and writes go through one long-lived connection guarded by a
+    lock, so an order write is a single WAL append rather than a fresh
+    connect + PRAGMA setup + fsync per call.
+    """
 
     def __init__(self, db_path: str = "./hypertrade.db", max_rows: int = 200):
         """Initialize database connection and create tables if needed.
@@ -26,63 +113,42 @@ class OrderDatabase:
         self.db_path = db_path
         self.max_rows = max_rows
         self._ensure_db_exists()
+        # Used from asyncio.to_thread worker threads (webhook writes and the
+        # history routes' reads), hence check_same_thread=False plus our own
+        # lock. Callers on the event loop must not call in directly: they
+        # would block the loop on this lock while a write holds it.
+        self._lock = threading.Lock()
+        self._conn = sqlite_util.connect(db_path, check_same_thread=False)
+        # Reads build dicts from cursor.description (_fetch_dicts) and writes
+        # consume no rows, so sqlite3.Row wrappers would be pure overhead here.
+        self._conn.row_factory = None
+        # Under WAL, NORMAL only fsyncs at checkpoints; the file stays
+        # consistent on power loss and this table is history, not the order.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with row factory."""
+        """Open a new, caller-owned connection with row factory."""
         return sqlite_util.connect(self.db_path)
 
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield the shared connection, serialised across threads."""
+        with self._lock:
+            yield self._conn
+
+    def close(self) -> None:
+        """Close the shared connection."""
+        with self._lock:
+            self._conn.close()
+
     def _ensure_db_exists(self) -> None:
         """Create database tables if they don't exist."""
         conn = self._get_connection()
-        cursor = conn.cursor()
-
-        # Orders table: tracks all executed orders (successful and failed)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS orders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                request_id TEXT UNIQUE,
-                timestamp TEXT NOT NULL,
-                symbol TEXT NOT NULL,
-                side TEXT NOT NULL,
-                signal TEXT NOT NULL,
-                quantity REAL NOT NULL,
-                price REAL NOT NULL,
-                leverage INTEGER,
-                subaccount TEXT,
-                status TEXT NOT NULL,
-                order_id TEXT,
-                avg_price REAL,
-                total_size REAL,
-                response_json TEXT,
-                execution_ms REAL
-            )
-        """)
-
-        # Failures table: detailed failure information
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS failures (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                order_id INTEGER,
-                request_id TEXT,
-                timestamp TEXT NOT NULL,
-                error_type TEXT NOT NULL,
-                error_message TEXT NOT NULL,
-                attempt INTEGER NOT NULL,
-                retry_count INTEGER DEFAULT 0,
-                FOREIGN KEY (order_id) REFERENCES orders(id)
-            )
-        """)
-
-        # Create indices for faster queries
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_timestamp ON orders(timestamp)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_symbol ON orders(symbol)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_request_id ON orders(request_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_failures_order_id ON failures(order_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_failures_timestamp ON failures(timestamp)")
-
-        conn.commit()
-        conn.close()
+        try:
+            conn.executescript(_SCHEMA_SQL)
+        finally:
+            conn.close()
 
         # Restrict database file permissions to owner only (rw-------)
         try:
@@ -131,53 +197,39 @@ class OrderDatabase:
         Returns:
             Order ID in database
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute("""
-                INSERT INTO orders (
-                    request_id, timestamp, symbol, side, signal, quantity, price,
-                    leverage, subaccount, status, order_id, avg_price, total_size,
-                    response_json, execution_ms
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                request_id,
-                datetime.now(timezone.utc).isoformat(),
-                symbol,
-                side,
-                signal,
-                # quantity/price may arrive as Decimal (exact, exchange-bound);
-                # the columns are REAL and sqlite3 cannot bind Decimal directly,
-                # so coerce here — the DB is history/analytics, not the order itself.
-                float(quantity),
-                float(price),
-                leverage,
-                subaccount,
-                status,
-                order_id,
-                avg_price,
-                total_size,
-                response_json,
-                execution_ms,
-            ))
-            cursor.execute(
-                "DELETE FROM orders WHERE id NOT IN "
-                "(SELECT id FROM orders ORDER BY id DESC LIMIT ?)",
-                (self.max_rows,),
-            )
-            conn.commit()
-            order_pk = cursor.lastrowid
-            log.debug(
-                "Order logged: id=%d request_id=%s symbol=%s side=%s status=%s",
-                order_pk, request_id, symbol, side, status
-            )
-            return order_pk
-        except sqlite3.IntegrityError:
-            log.warning("Duplicate request_id: %s", request_id)
-            raise
-        finally:
-            conn.close()
+        with self._connection() as conn:
+            try:
+                with conn:  # commits on success, rolls back on error
+                    cursor = conn.execute(_INSERT_ORDER_SQL, (
+                        request_id,
+                        datetime.now(timezone.utc).isoformat(),
+                        symbol,
+                        side,
+                        signal,
+                        # quantity/price may arrive as Decimal (exact, exchange-bound);
+                        # the columns are REAL and sqlite3 cannot bind Decimal directly,
+                        # so coerce here — the DB is history/analytics, not the order itself.
+                        float(quantity),
+                        float(price),
+                        leverage,
+                        subaccount,
+                        status,
+                        order_id,
+                        avg_price,
+                        total_size,
+                        response_json,
+                        execution_ms,
+                    ))
+                    order_pk = cursor.lastrowid
+                    conn.execute(_TRIM_ORDERS_SQL, (self.max_rows,))
+            except sqlite3.IntegrityError:
+                log.warning("Duplicate request_id: %s", request_id)
+                raise
+        log.debug(
+            "Order logged: id=%d request_id=%s symbol=%s side=%s status=%s",
+            order_pk, request_id, symbol, side, status
+        )
+        return order_pk
 
     def log_failure(
         self,
@@ -201,16 +253,8 @@ class OrderDatabase:
         Returns:
             Failure log ID in database
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute("""
-                INSERT INTO failures (
-                    order_id, request_id, timestamp, error_type, error_message,
-                    attempt, retry_count
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
+        with self._connection() as conn, conn:
+            cursor = conn.execute(_INSERT_FAILURE_SQL, (
                 order_id,
                 request_id,
                 datetime.now(timezone.utc).isoformat(),
@@ -219,20 +263,13 @@ class OrderDatabase:
                 attempt,
                 retry_count,
             ))
-            cursor.execute(
-                "DELETE FROM failures WHERE id NOT IN "
-                "(SELECT id FROM failures ORDER BY id DESC LIMIT ?)",
-                (self.max_rows,),
-            )
-            conn.commit()
             failure_id = cursor.lastrowid
-            log.debug(
-                "Failure logged: id=%d request_id=%s error_type=%s attempt=%d",
-                failure_id, request_id, error_type, attempt
-            )
-            return failure_id
-        finally:
-            conn.close()
+            conn.execute(_TRIM_FAILURES_SQL, (self.max_rows,))
+        log.debug(
+            "Failure logged: id=%d request_id=%s error_type=%s attempt=%d",
+            failure_id, request_id, error_type, attempt
+        )
+        return failure_id
 
     def get_orders(
         self,
@@ -254,9 +291,6 @@ class OrderDatabase:
         Returns:
             List of order dictionaries
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
         query = "SELECT * FROM orders WHERE 1=1"
         params: List[Any] = []
 
@@ -270,14 +304,11 @@ class OrderDatabase:
             query += " AND side = ?"
             params.append(side)
 
-        query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
+        query += " ORDER BY id DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [dict(row) for row in rows]
+        with self._connection() as conn:
+            return _fetch_dicts(conn, query, params)
 
     def get_failures(
         self,
@@ -295,9 +326,6 @@ class OrderDatabase:
         Returns:
             List of failure dictionaries
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
         query = "SELECT * FROM failures WHERE 1=1"
         params: List[Any] = []
 
@@ -305,14 +333,11 @@ class OrderDatabase:
             query += " AND error_type = ?"
             params.append(error_type)
 
-        query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
+        query += " ORDER BY id DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [dict(row) for row in rows]
+        with self._connection() as conn:
+            return _fetch_dicts(conn, query, params)
 
     def get_order_by_request_id(self, request_id: str) -> Optional[Dict[str, Any]]:
         """Get a single order by request ID.
@@ -323,14 +348,10 @@ class OrderDatabase:
         Returns:
             Order dictionary or None if not found
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            rows = _fetch_dicts(conn, "SELECT * FROM orders WHERE request_id = ?", (request_id,))
 
-        cursor.execute("SELECT * FROM orders WHERE request_id = ?", (request_id,))
-        row = cursor.fetchone()
-        conn.close()
-
-        return dict(row) if row else None
+        return rows[0] if rows else None
 
     def get_failures_by_order_id(self, order_id: int) -> List[Dict[str, Any]]:
         """Get all failures for a specific order.
@@ -341,14 +362,10 @@ class OrderDatabase:
         Returns:
             List of failure dictionaries
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM failures WHERE order_id = ? ORDER BY timestamp", (order_id,))
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [dict(row) for row in rows]
+        with self._connection() as conn:
+            return _fetch_dicts(
+                conn, "SELECT * FROM failures WHERE order_id = ? ORDER BY id", (order_id,)
+            )
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get summary statistics about orders and failures.
@@ -356,31 +373,26 @@ class OrderDatabase:
         Returns:
             Dictionary with stats
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) as total_orders FROM orders")
-        total_orders = cursor.fetchone()["total_orders"]
-
-        cursor.execute("SELECT COUNT(*) as failed_orders FROM orders WHERE status IN ('FAILED', 'REJECTED')")
-        failed_orders = cursor.fetchone()["failed_orders"]
-
-        cursor.execute("SELECT COUNT(*) as total_failures FROM failures")
-        total_failures = cursor.fetchone()["total_failures"]
-
-        cursor.execute("""
-            SELECT symbol, COUNT(*) as count FROM orders
-            GROUP BY symbol ORDER BY count DESC LIMIT 5
-        """)
-        top_symbols = [dict(row) for row in cursor.fetchall()]
-
-        cursor.execute("""
-            SELECT error_type, COUNT(*) as count FROM failures
-            GROUP BY error_type ORDER BY count DESC LIMIT 5
-        """)
-        top_errors = [dict(row) for row in cursor.fetchall()]
-
-        conn.close()
+        with self._connection() as conn:
+            # One statement for the three counts; the failed count is a
+            # covering-index probe on idx_orders_status, not a table scan.
+            total_orders, failed_orders, total_failures = conn.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM orders) AS total_orders,
+                    (SELECT COUNT(*) FROM orders
+                        WHERE status IN ('FAILED', 'REJECTED')) AS failed_orders,
+                    (SELECT COUNT(*) FROM failures) AS total_failures
+            """).fetchone()
+
+            top_symbols = _fetch_dicts(conn, """
+                SELECT symbol, COUNT(*) as count FROM orders
+                GROUP BY symbol ORDER BY count DESC LIMIT 5
+            """)
+
+            top_errors = _fetch_dicts(conn, """
+                SELECT error_type, COUNT(*) as count FROM failures
+                GROUP BY error_type ORDER BY count DESC LIMIT 5
+            """)
 
         return {
             "total_orders": total_orders,
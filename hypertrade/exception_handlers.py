@@ -1,99 +1,111 @@
 """Exception handlers for FastAPI app with concise JSON responses."""
 
 import logging as pylog
+from typing import Any, Optional
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 log = pylog.getLogger("uvicorn.error")
 
+
+def _json_default(obj: Any) -> str:
+    """Fallback for values orjson can't encode natively (bytes, exceptions in error ctx)."""
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.decode("utf-8", "replace")
+    return str(obj)
+
+
+# Fixed details for the statuses whose message never varies.
+_VALIDATION_DETAIL = "Request validation failed"
+_INTERNAL_DETAIL = "Internal server error"
+
+
+def error_response(
+    status_code: int, detail: Any, path: str, req_id: Optional[str], **extra: Any
+) -> Response:
+    """Serialize the uniform ``{"error": {...}}`` body with orjson in one pass.
+
+    No JSONResponse render hop and no pre-encoding walk; ``extra`` fields (the
+    422 ``errors`` list) sit between ``detail`` and ``path``. Public so error
+    responses produced outside the handlers (middleware) share the same shape.
+    """
+    body = orjson.dumps(
+        {
+            "error": {
+                "status": status_code,
+                "detail": detail,
+                **extra,
+                "path": path,
+                "request_id": req_id,
+            }
+        },
+        default=_json_default,
+        option=orjson.OPT_NON_STR_KEYS,
+    )
+    return Response(
+        body,
+        status_code=status_code,
+        media_type="application/json",
+        headers={"X-Request-ID": req_id} if req_id else None,
+    )
+
+
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handle Starlette HTTP exceptions uniformly."""
-    req_id = getattr(request.state, "request_id", None)
+    req_id = request.scope.get("request_id")
+    path = request.url.path
     # Optionally suppress noisy 404 logs from scans
     try:
-        settings = request.app.state.settings
-        suppress_404 = getattr(settings, "suppress_404_logs", False)
+        suppress_404 = request.app.state.settings.suppress_404_logs
     except AttributeError:
         suppress_404 = False
 
-    if not (suppress_404 and exc.status_code == 404):
+    if not (suppress_404 and exc.status_code == 404) and log.isEnabledFor(pylog.WARNING):
         log.warning(
             "HTTPException %s %s -> %s req_id=%s",
             request.method,
-            request.url.path,
+            path,
             exc.status_code,
             req_id,
         )
-    content = {
-        "error": {
-            "status": exc.status_code,
-            "detail": exc.detail,
-            "path": request.url.path,
-            "request_id": req_id,
-        }
-    }
-    # Use jsonable_encoder to avoid bytes/non-serializable types breaking dumps
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=jsonable_encoder(content),
-        headers={"X-Request-ID": req_id} if req_id else None,
-    )
+    return error_response(exc.status_code, exc.detail, path, req_id)
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle FastAPI validation errors with minimal noise."""
-    req_id = getattr(request.state, "request_id", None)
-    # Do not log stack traces for validation errors; keep concise
-    log.warning(
-        "ValidationError %s %s -> 422 req_id=%s errors=%s",
-        request.method,
-        request.url.path,
-        req_id,
-        exc.errors(),
-    )
-    content = {
-        "error": {
-            "status": 422,
-            "detail": "Request validation failed",
-            "errors": exc.errors(),
-            "path": request.url.path,
-            "request_id": req_id,
-        }
-    }
-    # Some validation contexts include bytes (e.g., raw body); encode safely
-    return JSONResponse(
-        status_code=422,
-        content=jsonable_encoder(content),
-        headers={"X-Request-ID": req_id} if req_id else None,
-    )
+    req_id = request.scope.get("request_id")
+    path = request.url.path
+    errors = exc.errors()
+    # Do not log stack traces for validation errors; keep concise. Skip building
+    # the args (URL, error list repr) when WARNING is filtered out.
+    if log.isEnabledFor(pylog.WARNING):
+        log.warning(
+            "ValidationError %s %s -> 422 req_id=%s errors=%s",
+            request.method,
+            path,
+            req_id,
+            errors,
+        )
+    # Some validation contexts include bytes (e.g., raw body); _json_default decodes them
+    return error_response(422, _VALIDATION_DETAIL, path, req_id, errors=errors)
 
 async def unhandled_exception_handler(request: Request, exc: Exception):
     """Catch-all handler for unexpected exceptions."""
-    req_id = getattr(request.state, "request_id", None)
+    req_id = request.scope.get("request_id")
+    path = request.url.path
     # Avoid stacktraces; summarize error type and request id
-    log.error(
-        "UnhandledError %s %s -> 500 err=%s req_id=%s",
-        request.method,
-        request.url.path,
-        exc.__class__.__name__,
-        req_id,
-    )
-    content = {
-        "error": {
-            "status": 500,
-            "detail": "Internal server error",
-            "path": request.url.path,
-            "request_id": req_id,
-        }
-    }
-    return JSONResponse(
-        status_code=500,
-        content=jsonable_encoder(content),
-        headers={"X-Request-ID": req_id} if req_id else None,
-    )
+    if log.isEnabledFor(pylog.ERROR):
+        log.error(
+            "UnhandledError %s %s -> 500 err=%s req_id=%s",
+            request.method,
+            path,
+            type(exc).__name__,
+            req_id,
+        )
+    return error_response(500, _INTERNAL_DETAIL, path, req_id)
 
 def register_exception_handlers(app: FastAPI) -> None:
     """Register all custom exception handlers on the app."""
@@ -1,7 +1,9 @@
 """Logging utilities: configure Uvicorn-compatible logs and startup banner."""
 
 import logging as pylog
-from typing import Iterable, Optional
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 try:  # FastAPI might not be installed in lint-only environments
     from fastapi.routing import APIRoute
@@ -40,6 +42,84 @@ def configure_logging(log_level: str = "INFO") -> None:
     # Configure app logger
     pylog.getLogger("hypertrade").setLevel(level)
 
+# Loggers uvicorn attaches its stream handlers to ("uvicorn.error" propagates
+# into "uvicorn"). Each gets its own queue so access/default formatting stays apart.
+_QUEUED_LOGGERS = ("uvicorn", "uvicorn.access")
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueue records untouched; the listener's handlers do all formatting.
+
+    The stock ``prepare()`` pre-formats the message and drops ``record.args``,
+    which uvicorn's AccessFormatter needs, and keeps formatting on the caller.
+    """
+
+    def prepare(self, record: pylog.LogRecord) -> pylog.LogRecord:
+        return record
+
+
+def start_log_queue() -> List[Tuple[str, QueueListener]]:
+    """Move uvicorn's handlers behind queues drained by background threads.
+
+    Request-path ``log.*`` calls then only enqueue the record; formatting and
+    the stream write happen on the listener thread. Call after uvicorn has
+    applied its logging config (i.e. at app startup), and pass the result to
+    :func:`stop_log_queue` on shutdown. Loggers without handlers, or already
+    behind a queue (a second startup in the same process), are left as-is so
+    records are never enqueued twice.
+    """
+    listeners = []
+    for name in _QUEUED_LOGGERS:
+        logger = pylog.getLogger(name)
+        handlers = logger.handlers[:]
+        if not handlers or any(isinstance(h, _DeferredQueueHandler) for h in handlers):
+            continue
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(records, *handlers, respect_handler_level=True)
+        for handler in handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(_DeferredQueueHandler(records))
+        listener.start()
+        listeners.append((name, listener))
+    return listeners
+
+
+def stop_log_queue(listeners: Iterable[Tuple[str, QueueListener]]) -> None:
+    """Flush each queue and put the original handlers back on their logger."""
+    for name, listener in listeners:
+        listener.stop()  # drains what is already queued
+        logger = pylog.getLogger(name)
+        for handler in logger.handlers[:]:
+            if isinstance(handler, _DeferredQueueHandler):
+                logger.removeHandler(handler)
+        for handler in listener.handlers:
+            logger.addHandler(handler)
+
+
+# The invariant parts of the startup banner, built once at import.
+_RULER = "═" * 88
+# Hypertrade ASCII art (compact + readable)
+_ART = "".join([
+    "██╗  ██╗██╗   ██╗██████╗ ███████╗██████╗ ████████╗██████╗  █████╗ ██████╗ ███████╗\n",
+    "██║  ██║╚██╗ ██╔╝██╔══██╗██╔══██╗██╔══██╗╚══██╔══╝██╔══██╗██╔══██╗██╔══██╗██╔════╝\n",
+    "███████║ ╚████╔╝ ██████╔╝█████╔╝ ██████╔╝   ██║   ██████╔╝███████║██║  ██║█████╗  \n",
+    "██╔══██║  ╚██╔╝  ██╔═══╝ ██╔══╝  ██╔══██╗   ██║   ██╔══██╗██╔══██║██║  ██║██╔══╝  \n",
+    "██║  ██║   ██║   ██║     ███████╗██║  ██║   ██║   ██║  ██║██║  ██║██████╔╝███████╗\n",
+    "╚═╝  ╚═╝   ╚═╝   ╚═╝     ╚══════╝╚═╝  ╚═╝   ╚═╝   ╚═╝  ╚═╝╚═╝  ╚═╝╚═════╝ ╚══════╝\n",
+])
+_BANNER_TEMPLATE = f"""{_RULER}
+{_ART}
+{_RULER}
+        Hypertrade Webhook Daemon v{{version}}
+        
+        Listening → {{url}}
+        IP Whitelist → {{wl_state}} ({{ip_count}} IP{{ip_plural}})
+        Trust X-Forwarded-For → {{xff}}
+        
+        Ready for TradingView webhooks!
+{_RULER}"""
+
+
 # pylint: disable=too-many-arguments
 def log_startup_banner(
     *,
@@ -51,57 +131,58 @@ def log_startup_banner(
     version: str = "1.0.0",  # pass __version__ or from importlib.metadata
 ) -> None:
     """Log the startup banner with configuration details."""
+    if not log.isEnabledFor(pylog.INFO):
+        return
     url = f"http://{host}:{port}" if port else f"http://{host}:<port from HYPERTRADE_LISTEN_PORT>"
     ip_count = len(set(str(ip) for ip in whitelist_ips if ip))
 
-    # Hypertrade ASCII art (compact + readable)
-    art = [
-        "██╗  ██╗██╗   ██╗██████╗ ███████╗██████╗ ████████╗██████╗  █████╗ ██████╗ ███████╗\n",
-        "██║  ██║╚██╗ ██╔╝██╔══██╗██╔══██╗██╔══██╗╚══██╔══╝██╔══██╗██╔══██╗██╔══██╗██╔════╝\n",
-        "███████║ ╚████╔╝ ██████╔╝█████╔╝ ██████╔╝   ██║   ██████╔╝███████║██║  ██║█████╗  \n",
-        "██╔══██║  ╚██╔╝  ██╔═══╝ ██╔══╝  ██╔══██╗   ██║   ██╔══██╗██╔══██║██║  ██║██╔══╝  \n",
-        "██║  ██║   ██║   ██║     ███████╗██║  ██║   ██║   ██║  ██║██║  ██║██████╔╝███████╗\n",
-        "╚═╝  ╚═╝   ╚═╝   ╚═╝     ╚══════╝╚═╝  ╚═╝   ╚═╝   ╚═╝  ╚═╝╚═╝  ╚═╝╚═════╝ ╚══════╝\n",
-    ]
+    banner = _BANNER_TEMPLATE.format(
+        version=version,
+        url=url,
+        wl_state="ENABLED" if whitelist_enabled else "disabled",
+        ip_count=ip_count,
+        ip_plural="s" if ip_count != 1 else "",
+        xff="YES" if trust_xff else "NO",
+    )
 
-    ruler = "═" * 88
+    # One record for the whole banner: one lock/format/handler pass, not one per line.
+    log.info("\n%s", banner)
+
+
+# Implicit methods Starlette adds to every route; not worth listing.
+_SKIP_METHODS = frozenset({"HEAD", "OPTIONS"})
 
-    banner = f"""
-{ruler}
-{"".join(art)}
-{ruler}
-        Hypertrade Webhook Daemon v{version}
-        
-        Listening → {url}
-        IP Whitelist → {'ENABLED' if whitelist_enabled else 'disabled'} ({ip_count} IP{'s' if ip_count != 1 else ''})
-        Trust X-Forwarded-For → {'YES' if trust_xff else 'NO'}
-        
-        Ready for TradingView webhooks!
-{ruler}
-    """
 
-    for line in banner.strip().splitlines():
-        log.info(line)
+def _iter_api_routes(routes) -> Iterator["APIRoute"]:
+    """Yield APIRoutes, descending into routers FastAPI keeps wrapped on include.
+
+    Newer FastAPI versions store ``include_router`` results as a wrapper exposing
+    ``original_router`` rather than copying the routes onto the app. Paths are
+    the ones declared on the router; Hypertrade includes its routers unprefixed.
+    """
+    for route in routes:
+        if isinstance(route, APIRoute):
+            yield route
+            continue
+        included = getattr(route, "original_router", None)
+        if included is not None:
+            yield from _iter_api_routes(included.routes)
 
 
 def log_endpoints(app) -> None:
     """Log all registered APIRoute endpoints."""
+    if not log.isEnabledFor(pylog.INFO):
+        return
     if APIRoute is None:
         log.info("FastAPI not available; skipping endpoint log.")
         return
 
-    lines = []
-    for route in getattr(app, "routes", []):
-        if isinstance(route, APIRoute):
-            methods = sorted(
-                m for m in (route.methods or []) if m not in {"HEAD", "OPTIONS"}
-            )
-            method_str = ",".join(methods) or "-"
-            lines.append((route.path, method_str, route.name))
-    
-    lines.sort(key=lambda x: (x[0], x[1]))
+    lines = [
+        (route.path, ",".join(sorted((route.methods or set()) - _SKIP_METHODS)) or "-", route.name)
+        for route in _iter_api_routes(app.routes)
+    ]
+    lines.sort()  # plain tuple order: path, then methods, then name
     header = f"Available endpoints ({len(lines)}):"
     
-    log.info("%s", header)
-    for path, methods, name in lines:
-        log.info("  %-7s %-40s (%s)", methods, path, name)
+    rows = [f"  {methods:<7} {path:<40} ({name})" for path, methods, name in lines]
+    log.info("%s", "\n".join([header, *rows]))
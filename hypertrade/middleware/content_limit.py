@@ -2,26 +2,42 @@
 
 from __future__ import annotations
 
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from ..exception_handlers import error_response
 
-class ContentLengthLimitMiddleware(BaseHTTPMiddleware):
-    """Reject requests exceeding ``max_bytes`` based on Content-Length header."""
+# 18 digits is already ~1 EB; longer Content-Length values are rejected unparsed.
+_MAX_DIGITS = 18
+
+
+class ContentLengthLimitMiddleware:
+    """Reject requests exceeding ``max_bytes`` based on Content-Length header.
+
+    Plain ASGI rather than ``BaseHTTPMiddleware``: it only reads a header, so it
+    skips the task-group/stream bridge and answers oversized requests itself
+    (an ``HTTPException`` raised from middleware never reaches the app's
+    exception handlers and would surface as a 500).
+    """
 
     def __init__(self, app: ASGIApp, max_bytes: int):
-        super().__init__(app)
+        self.app = app
         self.max_bytes = max_bytes
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Validate Content-Length and short-circuit with 413 if too large."""
-        cl = request.headers.get("content-length")
-        if cl is not None:
-            try:
-                size = int(cl)
-                if size > self.max_bytes:
-                    raise HTTPException(status_code=413, detail="Payload too large")
-            except ValueError:
-                pass
-        return await call_next(request)
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    # Predicate first: malformed values are ignored without
+                    # raising/catching a ValueError.
+                    if value.isdigit() and (
+                        len(value) > _MAX_DIGITS or int(value) > self.max_bytes
+                    ):
+                        # Runs before LoggingMiddleware mints a request id.
+                        response = error_response(
+                            413, "Payload too large", scope["path"], None
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
@@ -1,22 +1,27 @@
 from __future__ import annotations
 
+import math
 import time
 import threading
-from collections import deque
-from typing import Deque, Dict, Optional, Iterable, Tuple, List
+from typing import Dict, Optional, Iterable, Tuple
 
+import orjson
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from starlette.types import ASGIApp
 
 from ..security import _extract_client_ip
 
+# The 429 body never varies, so it is encoded once rather than per rejection.
+_TOO_MANY_REQUESTS_BODY = orjson.dumps({"error": {"status": 429, "detail": "Too Many Requests"}})
+
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Simple per-IP sliding window rate limiter.
+    """Simple per-IP token bucket rate limiter.
 
-    - Limits requests per `window_seconds` with optional `burst`.
+    - Each IP holds up to `max_requests + burst` tokens, refilled at
+      `max_requests / window_seconds` per second; a request spends one.
     - Respects `trust_forwarded_for` when extracting client IP.
     - Can target only specific `only_paths` and exclude `exclude_paths`.
     - Optionally allows a set of `whitelist_ips` to bypass limiting.
@@ -35,17 +40,32 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         whitelist_ips: Optional[Iterable[str]] = None,
     ):
         super().__init__(app)
+        if max_requests < 1 or window_seconds < 1:
+            raise ValueError("max_requests and window_seconds must be >= 1")
         self.max_requests = max_requests
         self.window = window_seconds
         self.burst = burst
         self.trust_forwarded_for = trust_forwarded_for
-        self.only_paths = set(only_paths or [])
-        self.exclude_paths = set(exclude_paths or [])
-        self.whitelist = set(whitelist_ips or [])
+        # frozenset() of a frozenset is a no-op, so pre-compiled sets pass straight through.
+        self.only_paths = frozenset(only_paths or ())
+        self.exclude_paths = frozenset(exclude_paths or ())
+        self.whitelist = frozenset(whitelist_ips or ())
+        # With no path filters every request is checked and the path is never read.
+        self._needs_path = bool(self.only_paths or self.exclude_paths)
+
+        self.capacity = float(max_requests + burst)
+        self._limit_header = str(max_requests + burst)
+        self.rate = max_requests / window_seconds  # tokens per second
+        self._seconds_per_token = window_seconds / max_requests  # multiply, don't divide
 
-        # In-memory state: ip -> deque[timestamps]
-        self._buckets: Dict[str, Deque[float]] = {}
+        # In-memory state: ip -> (tokens, last_refill). Two floats per IP,
+        # updated in O(1) regardless of the request rate.
+        self._buckets: Dict[str, Tuple[float, float]] = {}
         self._lock = threading.Lock()
+        # A bucket idle this long has refilled completely, so dropping it is
+        # indistinguishable from keeping it. Swept at most once per window.
+        self._idle_ttl = self.capacity * self._seconds_per_token
+        self._next_sweep = 0.0
 
     def _should_check(self, path: str) -> bool:
         if path in self.exclude_paths:
@@ -54,57 +74,58 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return True
         return path in self.only_paths
 
-    def _prune_and_count(self, now: float, dq: Deque[float]) -> int:
-        cutoff = now - self.window
-        while dq and dq[0] <= cutoff:
-            dq.popleft()
-        return len(dq)
+    def _sweep_idle(self, now: float) -> None:
+        """Drop buckets of IPs idle long enough to be full again (lock held)."""
+        cutoff = now - self._idle_ttl
+        self._buckets = {ip: b for ip, b in self._buckets.items() if b[1] > cutoff}
+        self._next_sweep = now + self.window
 
     def _allow(self, ip: str, now: float) -> Tuple[bool, int, float]:
         with self._lock:
-            dq = self._buckets.get(ip)
-            if dq is None:
-                dq = deque()
-                self._buckets[ip] = dq
-            count = self._prune_and_count(now, dq)
-            limit = self.max_requests + self.burst
-            if count >= limit:
-                # when will the window reset
-                reset_in = max(0.0, (dq[0] + self.window) - now) if dq else self.window
-                return False, max(0, limit - count), reset_in
-            dq.append(now)
-            remaining = max(0, limit - (count + 1))
-            reset_in = max(0.0, (dq[0] + self.window) - now) if dq else self.window
-            return True, remaining, reset_in
+            # Opportunistic sweep so memory tracks active IPs, not every IP seen.
+            if now >= self._next_sweep:
+                self._sweep_idle(now)
+            tokens, last = self._buckets.get(ip, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - last) * self.rate)
+            if tokens < 1.0:
+                self._buckets[ip] = (tokens, now)
+                # when the next token arrives
+                return False, 0, (1.0 - tokens) * self._seconds_per_token
+            tokens -= 1.0
+            self._buckets[ip] = (tokens, now)
+            # when the bucket is full again
+            return True, int(tokens), (self.capacity - tokens) * self._seconds_per_token
 
     async def dispatch(self, request: Request, call_next):
-        path = request.url.path
-        if not self._should_check(path):
+        # scope["path"] is the raw string; request.url would build a URL object.
+        if self._needs_path and not self._should_check(request.scope["path"]):
             return await call_next(request)
 
         ip = _extract_client_ip(request, self.trust_forwarded_for) or "-"
         if ip in self.whitelist:
             return await call_next(request)
 
-        now = time.time()
+        now = time.monotonic()
         allowed, remaining, reset_in = self._allow(ip, now)
         if not allowed:
-            return JSONResponse(
+            # Round up: a sub-second wait must not advertise "0".
+            retry_after = str(math.ceil(reset_in))
+            return Response(
+                _TOO_MANY_REQUESTS_BODY,
                 status_code=429,
-                content={"error": {"status": 429, "detail": "Too Many Requests"}},
+                media_type="application/json",
                 headers={
-                    "Retry-After": str(int(reset_in)),
-                    "X-RateLimit-Limit": str(self.max_requests + self.burst),
-                    "X-RateLimit-Remaining": str(max(0, remaining)),
-                    "X-RateLimit-Reset": str(int(reset_in)),
+                    "Retry-After": retry_after,
+                    "X-RateLimit-Limit": self._limit_header,
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": retry_after,
                 },
             )
 
         # Pass through
         response = await call_next(request)
         try:
-            limit_total = self.max_requests + self.burst
-            response.headers.setdefault("X-RateLimit-Limit", str(limit_total))
+            response.headers.setdefault("X-RateLimit-Limit", self._limit_header)
             response.headers.setdefault("X-RateLimit-Remaining", str(max(0, remaining)))
             response.headers.setdefault("X-RateLimit-Reset", str(int(reset_in)))
         except Exception:
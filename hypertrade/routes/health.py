@@ -3,9 +3,8 @@
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 
-from ..config import get_settings
 from .hyperliquid_service import HyperliquidService
 
 router = APIRouter(tags=["health"])
@@ -24,7 +23,7 @@ def health() -> dict[str, str]:
 
 
 @router.get("/ready", summary="Readiness probe")
-def readiness() -> dict:
+def readiness(request: Request) -> dict:
     """Readiness probe: verifies service is ready to handle requests.
 
     Checks:
@@ -41,7 +40,7 @@ def readiness() -> dict:
 
     # Verify Hyperliquid connectivity
     try:
-        settings = get_settings()
+        settings = request.app.state.settings
         client = HyperliquidService(
             base_url=settings.api_url,
             master_addr=settings.master_addr,
@@ -4,15 +4,50 @@ of the meta/asset-ctx snapshot.
 
 from __future__ import annotations
 
+import http.cookiejar
 import logging
 from typing import Any, Dict, Tuple, Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from hypertrade.config import get_settings
 from .hyperliquid_errors import HyperliquidValidationError, translate_request_errors
 
 log = logging.getLogger("uvicorn.error")
 
+# One pooled session for every client instance. Clients are built per request,
+# so a per-instance session would still pay a TCP + TLS handshake each time;
+# this one keeps connections to the info endpoint alive across requests.
+# No adapter-level retries: retry policy lives in the webhook retry loop.
+#
+# Thread safety: the session is called concurrently from asyncio.to_thread
+# workers. That is safe because nothing mutates it after import: the adapter is
+# mounted once here, urllib3's connection pool is thread-safe, and the cookie
+# jar — the one piece of per-response session state — rejects every cookie, so
+# the /info calls stay stateless and never share cookies across requests.
+_SESSION = requests.Session()
+_SESSION.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16))
+
+
+def post_info(info_url: str, payload: Dict[str, Any], timeout: int = 5) -> Any:
+    """POST ``payload`` to a Hyperliquid ``/info`` URL and return the decoded body.
+
+    Shared by the data and execution clients so pooling and decoding live in one
+    place: the request goes through the pooled session, the body is decoded with
+    orjson straight from bytes, and a malformed body is re-raised as requests'
+    ``InvalidJSONError`` (what ``resp.json()`` raised). Raw ``requests`` errors
+    propagate; wrap the call in ``translate_request_errors``.
+    """
+    resp = _SESSION.post(info_url, json=payload, timeout=timeout)
+    resp.raise_for_status()
+    try:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError as exc:
+        raise requests.exceptions.InvalidJSONError(str(exc), response=resp) from exc
+
+
 class HyperliquidDataClient:
     """
     Lightweight REST-first data client for Hyperliquid.
@@ -46,6 +81,9 @@ class HyperliquidDataClient:
         self._meta_cache: Dict[
             str, Tuple[list[Dict[str, Any]], list[Dict[str, Any]]]
         ] = {}
+        # Per-dex name -> universe position, built alongside each memoized
+        # snapshot so symbol lookups are a dict hit rather than a linear scan.
+        self._symbol_index: Dict[str, Dict[str, int]] = {}
 
         log.debug("HyperliquidDataClient initialized | Base URL: %s", self.info_url)
 
@@ -95,14 +133,16 @@ class HyperliquidDataClient:
 
     def get_meta(self, symbol: str) -> Dict[str, Any]:
         """Return the metadata entry for a symbol (dex-aware)."""
-        universe, _ = self._fetch_meta_and_asset_ctxs(self._dex_of(symbol))
-        idx = self._symbol_to_idx(symbol, universe)
+        dex = self._dex_of(symbol)
+        universe, _ = self._fetch_meta_and_asset_ctxs(dex)
+        idx = self._symbol_to_idx(symbol, universe, self._symbol_index[dex])
         return universe[idx]
 
     def get_all_mids(self) -> Dict[str, float]:
         """Return a mapping of non-index symbols to their mid prices."""
         data = self._post({"type": "allMids"})
-        return {s: float(p) for s, p in data.items() if not s.startswith("@")}
+        # Spot/index keys are "@<n>"; a one-char slice compare skips a method call per key.
+        return {s: float(p) for s, p in data.items() if s[:1] != "@"}
 
     def get_available_balance(self, address: Optional[str] = None) -> float:
         """Return the withdrawable balance for the provided or default address."""
@@ -128,15 +168,13 @@ class HyperliquidDataClient:
     def _post(self, payload: Dict[str, Any], timeout: int = 5) -> Any:
         """POST a JSON payload to the info endpoint and return the parsed body.
 
-        Centralizes the POST + raise_for_status + .json() sequence shared by all
-        data calls, translating raw `requests` transport failures into the
-        Hyperliquid error taxonomy so they reach the webhook retry loop instead
-        of surfacing as unhandled 500s.
+        Wraps :func:`post_info` (pooled POST + raise_for_status + orjson decode),
+        translating raw `requests` transport failures into the Hyperliquid error
+        taxonomy so they reach the webhook retry loop instead of surfacing as
+        unhandled 500s.
         """
         with translate_request_errors(f"data_client POST {payload.get('type', '?')}"):
-            resp = requests.post(self.info_url, json=payload, timeout=timeout)
-            resp.raise_for_status()
-            return resp.json()
+            return post_info(self.info_url, payload, timeout=timeout)
 
     @staticmethod
     def _dex_of(symbol: str) -> str:
@@ -154,21 +192,39 @@ class HyperliquidDataClient:
         if dex not in self._meta_cache:
             payload = {"type": "metaAndAssetCtxs"} if not dex else {"type": "metaAndAssetCtxs", "dex": dex}
             data = self._post(payload)
-            self._meta_cache[dex] = (data[0]["universe"], data[1])
+            universe = data[0]["universe"]
+            self._meta_cache[dex] = (universe, data[1])
+            self._symbol_index[dex] = self._index_universe(universe)
         return self._meta_cache[dex]
 
     def _get_ctx(self, symbol: str) -> Dict[str, Any]:
         """Fetch the asset context for a symbol (dex-aware)."""
-        universe, asset_ctxs = self._fetch_meta_and_asset_ctxs(self._dex_of(symbol))
-        idx = self._symbol_to_idx(symbol, universe)
+        dex = self._dex_of(symbol)
+        universe, asset_ctxs = self._fetch_meta_and_asset_ctxs(dex)
+        idx = self._symbol_to_idx(symbol, universe, self._symbol_index[dex])
         return asset_ctxs[idx]
 
     @staticmethod
-    def _symbol_to_idx(symbol: str, universe: list[Dict[str, Any]]) -> int:
-        """Return the index of a symbol within the provided universe."""
-        try:
-            return next(i for i, asset in enumerate(universe) if asset["name"] == symbol)
-        except StopIteration as exc:
+    def _index_universe(universe: list[Dict[str, Any]]) -> Dict[str, int]:
+        """Map each asset name in a universe to its position."""
+        return {asset["name"]: i for i, asset in enumerate(universe)}
+
+    @staticmethod
+    def _symbol_to_idx(
+        symbol: str,
+        universe: list[Dict[str, Any]],
+        index: Optional[Dict[str, int]] = None,
+    ) -> int:
+        """Return the index of a symbol within the provided universe.
+
+        ``index`` is the universe's precomputed name -> position map; when omitted
+        it is built from ``universe``.
+        """
+        if index is None:
+            index = HyperliquidDataClient._index_universe(universe)
+        idx = index.get(symbol)
+        if idx is None:
             raise HyperliquidValidationError(
                 f"Symbol '{symbol}' not found in Hyperliquid universe"
-            ) from exc
+            )
+        return idx
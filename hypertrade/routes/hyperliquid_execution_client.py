@@ -1,17 +1,15 @@
 from __future__ import annotations
 
 import logging
-from decimal import Decimal, ROUND_FLOOR, ROUND_CEILING
 from enum import Enum
 from typing import Literal, Any, Dict, Optional, Tuple
 
-import requests
 from eth_account import Account
 from hyperliquid.exchange import Exchange
 from hyperliquid.utils.types import Cloid
 from hypertrade.config import get_settings
 from hypertrade.logging import format_log_context
-from .hyperliquid_data_client import HyperliquidDataClient
+from .hyperliquid_data_client import HyperliquidDataClient, post_info
 from .hyperliquid_errors import translate_request_errors
 
 log = logging.getLogger("uvicorn.error")
@@ -38,6 +36,11 @@ class OrderStatus(Enum):
     FILLED = "filled"
     UNKNOWN = "unknown"
 
+# Status keys as plain strings: the per-status scan compares these directly
+# instead of resolving ``OrderStatus.X.value`` on every iteration.
+_RESTING = OrderStatus.RESTING.value
+_FILLED = OrderStatus.FILLED.value
+
 class HyperliquidExecutionClient:
     """
     Wrapper around Hyperliquid Exchange SDK.
@@ -279,9 +282,7 @@ class HyperliquidExecutionClient:
         payload = {"type": "orderStatus", "user": lookup_user, "oid": raw_cloid}
 
         with translate_request_errors("find_order_by_cloid"):
-            resp = requests.post(self.info_url, json=payload, timeout=5)
-            resp.raise_for_status()
-            data = resp.json()
+            data = post_info(self.info_url, payload, timeout=5)
 
         # "unknownOid" (or any non-"order" status) means the order never landed.
         if isinstance(data, dict) and data.get("status") == "order":
@@ -313,16 +314,16 @@ class HyperliquidExecutionClient:
 
     @staticmethod
     def _extract_oid_and_status(res: Dict[str, Any]) -> Tuple[int, OrderStatus]:
+        # The try is near-free on success (zero-cost on 3.11+); it only
+        # folds malformed payloads (KeyError/TypeError) into the ValueError callers expect.
         try:
             statuses = res["response"]["data"]["statuses"]
         
             for s in statuses:
-                if OrderStatus.RESTING.value in s:
-                    rest = s[OrderStatus.RESTING.value]
-                    return int(rest["oid"]), OrderStatus.RESTING
-                if OrderStatus.FILLED.value in s:
-                    filled = s[OrderStatus.FILLED.value]
-                    return int(filled["oid"]), OrderStatus.FILLED
+                if _RESTING in s:
+                    return int(s[_RESTING]["oid"]), OrderStatus.RESTING
+                if _FILLED in s:
+                    return int(s[_FILLED]["oid"]), OrderStatus.FILLED
         
             # Fallback: check for error
             if statuses and "error" in statuses[0]:
@@ -334,15 +335,6 @@ class HyperliquidExecutionClient:
         except (KeyError, TypeError, ValueError) as exc:
             raise ValueError(f"Failed to parse order response: {res}") from exc
 
-    def _get_tick_size(self, symbol: str) -> Decimal:
-        """Return tick size (e.g., 0.001 for 3 decimals)"""
-        try:
-            meta = self.data.get_meta(symbol)
-            decimals = int(meta.get("szDecimals", 3))  # fallback to 3
-            return Decimal("1") / Decimal("10") ** decimals
-        except (TypeError, ValueError):
-            return Decimal("0.001")
-
     def _normalize_price(self, symbol: str, price: float, is_buy: bool) -> float:
         if price <= 0:
             raise ValueError(f"Invalid price: {price}")
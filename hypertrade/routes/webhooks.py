@@ -12,14 +12,14 @@ import re
 from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import JSONResponse
 from jsonschema import (
-    validate as jsonschema_validate,
+    Draft202012Validator,
     ValidationError as JSONSchemaValidationError,
 )
 
-from ..config import get_settings
 from ..schemas.tradingview_schema import TRADINGVIEW_SCHEMA
 from ..schemas.tradingview import TradingViewWebhook
 from ..security import require_ip_whitelisted, require_bearer_secret
@@ -41,6 +41,10 @@ router = APIRouter(tags=["webhooks"])
 history_router = APIRouter(tags=["history"], dependencies=[Depends(require_bearer_secret)])
 log = logging.getLogger("uvicorn.error")
 
+# Built once: jsonschema.validate() re-checks the schema and constructs a new
+# validator on every call, which dominated per-webhook validation time.
+_SCHEMA_VALIDATOR = Draft202012Validator(TRADINGVIEW_SCHEMA)
+
 def _derive_cloid(seed: str) -> str:
     """Derive a deterministic Hyperliquid client order id (cloid) from a seed.
 
@@ -162,6 +166,9 @@ async def hypertrade_webhook(
 ) -> dict:
     """Main webhook endpoint: validates, parses, logs, and returns a summary."""
     start_time = time.perf_counter()
+    # Bind per-request state once; settings were attached to app.state at startup.
+    state = request.app.state
+    settings = state.settings
     
     # Let's start with our checks.
 
@@ -180,7 +187,7 @@ async def hypertrade_webhook(
 
     payload = TradingViewWebhook.model_validate(raw)
 
-    idempotency = getattr(request.app.state, "idempotency", None)
+    idempotency = getattr(state, "idempotency", None)
     nonce = payload.general.nonce
     if idempotency is not None and not nonce:
         raise HTTPException(status_code=400, detail="general.nonce is required")
@@ -237,7 +244,6 @@ async def hypertrade_webhook(
     # ===================================================================
     # Config & Clients.
     # ===================================================================
-    settings = get_settings()
     vault_address: Optional[str] = settings.subaccount_addr
     leverage = _parse_leverage(payload.general.leverage)
 
@@ -255,7 +261,7 @@ async def hypertrade_webhook(
     # re-send of the SAME nonce, so the exchange dedupes a duplicate submission and
     # the retry loop can query-before-resubmit. Seed from nonce (preferred) or the
     # request id (always present) so a cloid is always available.
-    req_id = getattr(request.state, "request_id", None)
+    req_id = request.scope.get("request_id")
     cloid_seed = nonce or req_id
     cloid = _derive_cloid(cloid_seed) if cloid_seed else None
 
@@ -313,13 +319,12 @@ async def hypertrade_webhook(
     # EXECUTION: Place the order with retry logic.
     # ===================================================================
 
-    req_id = getattr(request.state, "request_id", None)
-    db = getattr(request.app.state, "db", None)
+    db = getattr(state, "db", None)
 
     if idempotency is not None:
         try:
             reservation = idempotency.reserve(
-                nonce, req_id, get_settings().idempotency_inflight_timeout
+                nonce, req_id, settings.idempotency_inflight_timeout
             )
         except sqlite3.Error as exc:
             log.warning("Idempotency store unavailable during reserve: %s", exc)
@@ -343,7 +348,8 @@ async def hypertrade_webhook(
             handler_ctx,
         )
         if db and req_id:
-            db.log_order(
+            await asyncio.to_thread(
+                db.log_order,
                 request_id=req_id,
                 symbol=symbol,
                 side=side.value,
@@ -355,7 +361,8 @@ async def hypertrade_webhook(
                 status="REJECTED",
                 execution_ms=(time.perf_counter() - start_time) * 1000,
             )
-            db.log_failure(
+            await asyncio.to_thread(
+                db.log_failure,
                 request_id=req_id,
                 error_type=e.__class__.__name__,
                 error_message=str(e),
@@ -369,7 +376,8 @@ async def hypertrade_webhook(
             handler_ctx,
         )
         if db and req_id:
-            db.log_order(
+            await asyncio.to_thread(
+                db.log_order,
                 request_id=req_id,
                 symbol=symbol,
                 side=side.value,
@@ -381,7 +389,8 @@ async def hypertrade_webhook(
                 status="FAILED",
                 execution_ms=(time.perf_counter() - start_time) * 1000,
             )
-            db.log_failure(
+            await asyncio.to_thread(
+                db.log_failure,
                 request_id=req_id,
                 error_type=e.__class__.__name__,
                 error_message=str(e),
@@ -398,7 +407,8 @@ async def hypertrade_webhook(
             handler_ctx,
         )
         if db and req_id:
-            db.log_order(
+            await asyncio.to_thread(
+                db.log_order,
                 request_id=req_id,
                 symbol=symbol,
                 side=side.value,
@@ -410,7 +420,8 @@ async def hypertrade_webhook(
                 status="FAILED",
                 execution_ms=(time.perf_counter() - start_time) * 1000,
             )
-            db.log_failure(
+            await asyncio.to_thread(
+                db.log_failure,
                 request_id=req_id,
                 error_type=e.__class__.__name__,
                 error_message=str(e),
@@ -430,7 +441,8 @@ async def hypertrade_webhook(
 
     # Log successful order
     if db and req_id:
-        db.log_order(
+        await asyncio.to_thread(
+            db.log_order,
             request_id=req_id,
             symbol=symbol,
             side=side.value,
@@ -569,11 +581,8 @@ def secret_enforcement(request: Request, raw: dict) -> None:
     If `HYPERTRADE_WEBHOOK_SECRET` (via settings) is set, the request JSON must
     contain a matching `general.secret`. Otherwise raise 401.
     """
-    settings = request.app.state.settings
-    env_secret = None
-
-    if getattr(settings, "webhook_secret", None):
-        env_secret = settings.webhook_secret.get_secret_value()
+    webhook_secret = request.app.state.settings.webhook_secret
+    env_secret = webhook_secret.get_secret_value() if webhook_secret else None
 
     if env_secret:
         incoming = raw.get("general", {}).get("secret")
@@ -616,15 +625,11 @@ async def _log_invalid_json_body(request: Request) -> None:
     # Fetching the secret must never turn this logging helper into a 500 — fall
     # back to None (the regex still masks the JSON `secret` field) on any failure.
     try:
-        settings = get_settings()
-        secret = (
-            settings.webhook_secret.get_secret_value()
-            if getattr(settings, "webhook_secret", None)
-            else None
-        )
+        webhook_secret = request.app.state.settings.webhook_secret
+        secret = webhook_secret.get_secret_value() if webhook_secret else None
     except Exception:  # pylint: disable=broad-except
         secret = None
-    req_id = getattr(request.state, "request_id", None)
+    req_id = request.scope.get("request_id")
     log.warning("Invalid JSON body req_id=%s body=%s", req_id, _redact_secrets(body_text, secret))
 
 def _require_json_content_type(request: Request) -> None:
@@ -637,9 +642,13 @@ def _require_json_content_type(request: Request) -> None:
         )
 
 async def _read_json_body(request: Request) -> dict:
-    """Read and parse JSON body; log full body on failure and raise 422."""
+    """Read and parse JSON body; log full body on failure and raise 422.
+
+    Decoded with orjson (same value types as ``json.loads``; its decode error
+    is a ``ValueError``) rather than Starlette's stdlib-based ``request.json()``.
+    """
     try:
-        return await request.json()
+        return orjson.loads(await request.body())
     except (ValueError, TypeError, UnicodeDecodeError) as exc:
         await _log_invalid_json_body(request)
         raise HTTPException(status_code=422, detail="Invalid JSON body") from exc
@@ -647,7 +656,7 @@ async def _read_json_body(request: Request) -> dict:
 def _validate_schema(raw: dict) -> None:
     """Validate payload against TradingView JSON schema; raise 422 with detail on error."""
     try:
-        jsonschema_validate(instance=raw, schema=TRADINGVIEW_SCHEMA)
+        _SCHEMA_VALIDATOR.validate(raw)
     except JSONSchemaValidationError as exc:
         raise HTTPException(status_code=422, detail="JSON schema validation error") from exc
 
@@ -693,6 +702,9 @@ def _build_dry_run_response(
 # ═══════════════════════════════════════════════════════════════════════════
 # History & Analytics Endpoints
 # ═══════════════════════════════════════════════════════════════════════════
+# Reads go through asyncio.to_thread like the writes: OrderDatabase serialises
+# its shared connection with a threading.Lock, and waiting on it from the event
+# loop would stall every request while an order write holds it.
 
 @history_router.get(
     "/history/orders",
@@ -725,7 +737,9 @@ async def get_orders_history(
     limit = min(max(1, limit), 1000)
     offset = max(0, offset)
 
-    orders = db.get_orders(limit=limit, offset=offset, symbol=symbol, status=status, side=side)
+    orders = await asyncio.to_thread(
+        db.get_orders, limit=limit, offset=offset, symbol=symbol, status=status, side=side
+    )
     return {
         "status": "ok",
         "count": len(orders),
@@ -762,7 +776,9 @@ async def get_failures_history(
     limit = min(max(1, limit), 1000)
     offset = max(0, offset)
 
-    failures = db.get_failures(limit=limit, offset=offset, error_type=error_type)
+    failures = await asyncio.to_thread(
+        db.get_failures, limit=limit, offset=offset, error_type=error_type
+    )
     return {
         "status": "ok",
         "count": len(failures),
@@ -792,11 +808,15 @@ async def get_order_details(
     if not db:
         raise HTTPException(status_code=503, detail="Database not available")
 
-    order = db.get_order_by_request_id(request_id)
+    order = await asyncio.to_thread(db.get_order_by_request_id, request_id)
     if not order:
         raise HTTPException(status_code=404, detail=f"Order not found: {request_id}")
 
-    failures = db.get_failures_by_order_id(order["id"]) if order.get("id") else []
+    failures = (
+        await asyncio.to_thread(db.get_failures_by_order_id, order["id"])
+        if order.get("id")
+        else []
+    )
 
     return {
         "status": "ok",
@@ -819,7 +839,7 @@ async def get_statistics(request: Request) -> dict:
     if not db:
         raise HTTPException(status_code=503, detail="Database not available")
 
-    stats = db.get_statistics()
+    stats = await asyncio.to_thread(db.get_statistics)
     return {
         "status": "ok",
         "statistics": stats,
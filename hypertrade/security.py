@@ -3,9 +3,7 @@
 import hmac
 from typing import Iterable, Optional
 
-from fastapi import Depends, HTTPException, Request
-
-from .config import get_settings
+from fastapi import HTTPException, Request
 
 
 def _extract_client_ip(request: Request, trust_forwarded_for: bool) -> Optional[str]:
@@ -37,31 +35,43 @@ def require_bearer_secret(request: Request) -> None:
     Raises 403 if no webhook secret is configured (the resource cannot be
     unlocked), 401 if the header is missing/malformed or the token is wrong.
     """
-    settings = request.app.state.settings
-    env_secret = getattr(settings, "webhook_secret", None)
-    if not env_secret:
+    # Bytes prepared at startup (see create_daemon), so no SecretStr unwrap here.
+    expected = request.app.state.bearer_secret
+    if not expected:
         raise HTTPException(status_code=403, detail="Forbidden: webhook secret not configured")
 
     auth_header = request.headers.get("Authorization", "")
-    if not auth_header.startswith("Bearer "):
+    if auth_header[:7] != "Bearer ":
         raise HTTPException(status_code=401, detail="Unauthorized: missing Bearer token")
 
-    provided = auth_header[7:]  # strip "Bearer "
-    if not hmac.compare_digest(provided, env_secret.get_secret_value()):
+    # Header values are latin-1 decoded, so this recovers the raw bytes sent;
+    # a bytes compare also cannot raise on non-ASCII input the way str does.
+    provided = auth_header[7:].encode("latin-1")
+    if not hmac.compare_digest(provided, expected):
         raise HTTPException(status_code=401, detail="Unauthorized: invalid secret")
 
 
 def require_ip_whitelisted(allowed_ips: Optional[Iterable[str]] = None):
     """FastAPI dependency that enforces a simple IP whitelist.
 
-    If app settings have ``ip_whitelist_enabled`` on, only requests from ``allowed_ips``
-    (or ``settings.tv_webhook_ips`` when not provided) are permitted.
+    If the app's settings (``app.state.settings``) have ``ip_whitelist_enabled`` on,
+    only requests from ``allowed_ips`` (or ``settings.tv_webhook_ips`` when not
+    provided) are permitted. The allowed
+    set is built once — here for ``allowed_ips``, or at startup on
+    ``app.state.tv_webhook_ips`` — never per request.
     """
-    async def dependency(request: Request, settings=Depends(get_settings)):
+    static_ips = frozenset(allowed_ips) if allowed_ips else None
+
+    async def dependency(request: Request):
+        settings = request.app.state.settings
         if not settings.ip_whitelist_enabled:
             return  # whitelist disabled; allow
 
-        ips = set(allowed_ips or settings.tv_webhook_ips or [])
+        ips = static_ips
+        if ips is None:
+            ips = getattr(request.app.state, "tv_webhook_ips", None)
+        if ips is None:
+            ips = frozenset(settings.tv_webhook_ips or ())
         client_ip = _extract_client_ip(request, settings.trust_forwarded_for)
         if client_ip is None or client_ip not in ips:
             raise HTTPException(status_code=403, detail="Forbidden: IP not allowed")
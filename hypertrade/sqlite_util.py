@@ -24,7 +24,7 @@ import sqlite3
 BUSY_TIMEOUT_MS = 5000
 
 
-def connect(db_path: str) -> sqlite3.Connection:
+def connect(db_path: str, *, check_same_thread: bool = True) -> sqlite3.Connection:
     """Open a SQLite connection configured for concurrent thread access.
 
     Preserves the semantics the stores previously relied on (default
@@ -35,12 +35,15 @@ def connect(db_path: str) -> sqlite3.Connection:
 
     Args:
         db_path: Filesystem path to the SQLite database file.
+        check_same_thread: Passed through to :func:`sqlite3.connect`. Only a
+            store that serialises access to a shared connection itself may
+            set this to ``False``.
 
     Returns:
         A configured, open :class:`sqlite3.Connection`. The caller owns it and
         is responsible for closing it.
     """
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
     # Errors here must propagate: a connection that cannot honour these PRAGMAs
     # would silently reintroduce the locking bug, so never swallow them.
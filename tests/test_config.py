@@ -152,3 +152,39 @@ def test_max_history_rows_must_be_positive(monkeypatch) -> None:
     monkeypatch.setenv("HYPERTRADE_MAX_HISTORY_ROWS", "0")
     with pytest.raises(ValueError, match="max_history_rows"):
         Settings(_env_file=None)
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [("debug", "DEBUG"), (" Warning ", "WARNING"), ("CRITICAL", "CRITICAL"), ("bogus", "INFO")],
+)
+def test_log_level_is_canonicalized_with_info_fallback(monkeypatch, raw, expected) -> None:
+    """Level names are case/whitespace-insensitive; unknown names fall back to INFO."""
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("HYPERTRADE_LOG_LEVEL", raw)
+
+    assert _make_settings().log_level == expected
+
+
+@pytest.mark.parametrize(
+    "env_var",
+    ["HYPERTRADE_RATE_LIMIT_MAX_REQUESTS", "HYPERTRADE_RATE_LIMIT_WINDOW_SECONDS"],
+)
+def test_zero_rate_limit_setting_is_rejected_at_startup(monkeypatch, env_var) -> None:
+    """A zero limit or window would divide by zero in the bucket refill."""
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv(env_var, "0")
+
+    with pytest.raises(ValueError, match=env_var.removeprefix("HYPERTRADE_").lower()):
+        _make_settings()
+
+
+def test_api_url_follows_environment_after_model_copy(monkeypatch) -> None:
+    """api_url is derived on access, so a copy with another environment never
+    reports the original's URL."""
+    _set_required_env(monkeypatch)
+    settings = _make_settings()
+    assert settings.api_url == "https://api.hyperliquid-testnet.xyz"
+
+    prod = settings.model_copy(update={"environment": "prod"})
+    assert prod.api_url == "https://api.hyperliquid.xyz"
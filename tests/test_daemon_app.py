@@ -0,0 +1,142 @@
+"""App construction: the module-level ``app`` is built once, on first access, and
+the interactive API docs are only served off mainnet."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+REPO_ROOT = str(pathlib.Path(__file__).resolve().parents[1])
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def _set_env(monkeypatch, environment: str = "test") -> None:
+    monkeypatch.setenv("HYPERTRADE_ENVIRONMENT", environment)
+    monkeypatch.setenv("HYPERTRADE_MASTER_ADDR", "0xMASTER")
+    monkeypatch.setenv("HYPERTRADE_API_WALLET_PRIV", "dummy-priv-key")
+    monkeypatch.setenv("HYPERTRADE_WEBHOOK_SECRET", "secret")
+    monkeypatch.setenv("HYPERTRADE_DB_ENABLED", "false")
+    monkeypatch.setenv("HYPERTRADE_IDEMPOTENCY_ENABLED", "false")
+
+
+def test_daemon_app_is_built_once_on_first_access(monkeypatch):
+    _set_env(monkeypatch)
+
+    from hypertrade import daemon
+
+    daemon.get_settings.cache_clear()
+    # Start from an unbuilt module regardless of what earlier tests touched.
+    monkeypatch.delitem(vars(daemon), "app", raising=False)
+
+    calls = []
+    real_create = daemon.create_daemon
+
+    def counting_create():
+        calls.append(1)
+        return real_create()
+
+    monkeypatch.setattr(daemon, "create_daemon", counting_create)
+
+    first = daemon.app
+    from hypertrade.daemon import app as second
+
+    assert first is second
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("environment, expected", [("test", 200), ("prod", 404)])
+def test_openapi_docs_only_served_off_mainnet(monkeypatch, environment, expected):
+    _set_env(monkeypatch, environment)
+
+    from hypertrade import daemon
+
+    daemon.get_settings.cache_clear()
+    app = daemon.create_daemon()
+    client = TestClient(app)
+
+    # Built at startup on testnet; never built on mainnet.
+    assert (app.openapi_schema is not None) is (expected == 200)
+    assert client.get("/docs").status_code == expected
+    assert client.get("/openapi.json").status_code == expected
+    assert client.get("/redoc").status_code == 404
+
+
+def test_log_endpoints_lists_routes_from_included_routers(monkeypatch, caplog):
+    _set_env(monkeypatch)
+
+    from hypertrade import daemon
+    from hypertrade.logging import log_endpoints
+
+    daemon.get_settings.cache_clear()
+    app = daemon.create_daemon()
+    caplog.clear()
+    with caplog.at_level("INFO", logger="uvicorn.error"):
+        log_endpoints(app)
+
+    table = caplog.records[-1].getMessage()
+    assert table.startswith("Available endpoints (7):")
+    assert "POST    /webhook" in table
+    assert "HEAD" not in table
+
+
+def test_startup_logs_skip_all_work_above_info(caplog):
+    from hypertrade.logging import log_endpoints, log_startup_banner
+
+    class _NoRoutes:
+        @property
+        def routes(self):
+            raise AssertionError("routes walked although INFO is disabled")
+
+    caplog.clear()
+    with caplog.at_level("WARNING", logger="uvicorn.error"):
+        log_startup_banner(host="0.0.0.0", port=6487)
+        log_endpoints(_NoRoutes())
+
+    assert caplog.records == []
+
+
+def test_shutdown_closes_the_order_database(monkeypatch, tmp_path):
+    _set_env(monkeypatch)
+    monkeypatch.setenv("HYPERTRADE_DB_ENABLED", "true")
+    monkeypatch.setenv("HYPERTRADE_DB_PATH", str(tmp_path / "orders.db"))
+
+    import sqlite3
+
+    from hypertrade import daemon
+
+    daemon.get_settings.cache_clear()
+    app = daemon.create_daemon()
+    with TestClient(app):
+        assert app.state.db.get_statistics()["total_orders"] == 0
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        app.state.db.get_statistics()
+    # Last connection closed cleanly: SQLite checkpointed and removed the WAL.
+    assert not (tmp_path / "orders.db-wal").exists()
+
+
+def test_log_queue_is_stopped_even_if_db_close_fails(monkeypatch):
+    _set_env(monkeypatch)
+
+    from hypertrade import daemon
+
+    daemon.get_settings.cache_clear()
+    app = daemon.create_daemon()
+
+    class _FailingDb:
+        def close(self):
+            raise OSError("disk full")
+
+    stopped = []
+    monkeypatch.setattr("hypertrade.logging.stop_log_queue", stopped.append)
+    app.state.db = _FailingDb()
+
+    with pytest.raises(OSError, match="disk full"):
+        with TestClient(app):
+            pass
+
+    assert len(stopped) == 1
@@ -5,6 +5,8 @@ from __future__ import annotations
 import pathlib
 import sys
 
+import pytest
+
 REPO_ROOT = str(pathlib.Path(__file__).resolve().parents[1])
 if REPO_ROOT not in sys.path:
     sys.path.insert(0, REPO_ROOT)
@@ -28,6 +30,21 @@ def _order_request_ids(db: OrderDatabase) -> list[str]:
         conn.close()
 
 
+@pytest.fixture
+def make_db(tmp_path):
+    """Build OrderDatabases on a temp file and close their shared connection after."""
+    dbs: list[OrderDatabase] = []
+
+    def _make(**kwargs) -> OrderDatabase:
+        db = OrderDatabase(str(tmp_path / "h.db"), **kwargs)
+        dbs.append(db)
+        return db
+
+    yield _make
+    for db in dbs:
+        db.close()
+
+
 def _log_order(db: OrderDatabase, rid: str) -> None:
     db.log_order(
         request_id=rid, symbol="SOL", side="buy", signal="OPEN_LONG",
@@ -35,27 +52,47 @@ def _log_order(db: OrderDatabase, rid: str) -> None:
     )
 
 
-def test_default_max_rows_is_200(tmp_path):
-    assert OrderDatabase(str(tmp_path / "h.db")).max_rows == 200
+def test_default_max_rows_is_200(make_db):
+    assert make_db().max_rows == 200
 
 
-def test_orders_capped_to_max_rows_keeping_newest(tmp_path):
-    db = OrderDatabase(str(tmp_path / "h.db"), max_rows=3)
+def test_orders_capped_to_max_rows_keeping_newest(make_db):
+    db = make_db(max_rows=3)
     for i in range(5):
         _log_order(db, f"r{i}")
     assert _count(db, "orders") == 3
     assert _order_request_ids(db) == ["r2", "r3", "r4"]  # newest 3 survive
 
 
-def test_under_cap_keeps_all_orders(tmp_path):
-    db = OrderDatabase(str(tmp_path / "h.db"), max_rows=10)
+def test_under_cap_keeps_all_orders(make_db):
+    db = make_db(max_rows=10)
     for i in range(4):
         _log_order(db, f"r{i}")
     assert _count(db, "orders") == 4
 
 
-def test_failures_capped_to_max_rows(tmp_path):
-    db = OrderDatabase(str(tmp_path / "h.db"), max_rows=2)
+def test_failures_capped_to_max_rows(make_db):
+    db = make_db(max_rows=2)
     for i in range(5):
         db.log_failure(request_id=f"r{i}", error_type="Net", error_message="boom")
     assert _count(db, "failures") == 2
+
+
+def test_get_orders_returns_newest_insert_first(make_db):
+    db = make_db(max_rows=10)
+    for i in range(3):
+        _log_order(db, f"r{i}")
+    assert [o["request_id"] for o in db.get_orders(limit=2)] == ["r2", "r1"]
+
+
+def test_statistics_counts_orders_failed_and_failures(make_db):
+    db = make_db(max_rows=10)
+    _log_order(db, "r0")
+    db.log_order(
+        request_id="r1", symbol="SOL", side="buy", signal="OPEN_LONG",
+        quantity=1, price=100, status="REJECTED",
+    )
+    db.log_failure(request_id="r1", error_type="Net", error_message="boom")
+    stats = db.get_statistics()
+    assert (stats["total_orders"], stats["failed_orders"], stats["total_failures"]) == (2, 1, 1)
+    assert stats["success_rate"] == 50
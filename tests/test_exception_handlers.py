@@ -0,0 +1,43 @@
+"""Error responses are rendered by orjson without a jsonable_encoder pre-pass."""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+from types import SimpleNamespace
+
+REPO_ROOT = str(pathlib.Path(__file__).resolve().parents[1])
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from fastapi.exceptions import RequestValidationError
+
+from hypertrade.exception_handlers import validation_exception_handler
+
+
+async def test_validation_error_body_encodes_bytes_and_exception_ctx() -> None:
+    """Raw-body bytes and exception objects in ``ctx`` must not break the 422 body."""
+    exc = RequestValidationError([
+        {
+            "type": "value_error",
+            "loc": ("body",),
+            "msg": "bad",
+            "input": b"\xff raw",
+            "ctx": {"error": ValueError("bad value")},
+        }
+    ])
+    req = SimpleNamespace(
+        scope={"request_id": "rid-1"},
+        method="POST",
+        url=SimpleNamespace(path="/webhook"),
+    )
+
+    resp = await validation_exception_handler(req, exc)
+
+    assert resp.status_code == 422
+    assert resp.headers["X-Request-ID"] == "rid-1"
+    error = json.loads(resp.body)["error"]["errors"][0]
+    assert error["loc"] == ["body"]
+    assert error["input"] == "� raw"
+    assert error["ctx"] == {"error": "bad value"}
@@ -14,6 +14,7 @@ import pathlib
 import sys
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 import requests
 
@@ -25,6 +26,7 @@ from hyperliquid.utils.types import Cloid
 
 from hypertrade.routes.hyperliquid_execution_client import (
     HyperliquidExecutionClient,
+    OrderStatus,
     PositionSide,
 )
 from hypertrade.routes.hyperliquid_errors import (
@@ -98,18 +100,19 @@ def test_find_order_by_cloid_found(monkeypatch):
         def raise_for_status(self) -> None:
             return None
 
-        def json(self) -> dict:
-            return found
+        @property
+        def content(self) -> bytes:
+            return orjson.dumps(found)
 
     captured = {}
 
-    def _post(url, json=None, timeout=None):  # noqa: A002 - mirror requests.post sig
+    def _post(url, json=None, timeout=None):  # noqa: A002 - mirror Session.post sig
         captured["url"] = url
         captured["payload"] = json
         return _Resp()
 
     monkeypatch.setattr(
-        "hypertrade.routes.hyperliquid_execution_client.requests.post", _post
+        "hypertrade.routes.hyperliquid_data_client._SESSION.post", _post
     )
 
     result = client.find_order_by_cloid(_VALID_CLOID, user="0xMASTER")
@@ -131,11 +134,12 @@ def test_find_order_by_cloid_not_found_returns_none(monkeypatch):
         def raise_for_status(self) -> None:
             return None
 
-        def json(self) -> dict:
-            return {"status": "unknownOid"}
+        @property
+        def content(self) -> bytes:
+            return orjson.dumps({"status": "unknownOid"})
 
     monkeypatch.setattr(
-        "hypertrade.routes.hyperliquid_execution_client.requests.post",
+        "hypertrade.routes.hyperliquid_data_client._SESSION.post",
         lambda *a, **k: _Resp(),
     )
 
@@ -151,7 +155,7 @@ def test_find_order_by_cloid_network_error_is_translated(monkeypatch):
         raise requests.ConnectionError("dropped")
 
     monkeypatch.setattr(
-        "hypertrade.routes.hyperliquid_execution_client.requests.post", _raise
+        "hypertrade.routes.hyperliquid_data_client._SESSION.post", _raise
     )
 
     with pytest.raises(HyperliquidNetworkError):
@@ -166,11 +170,10 @@ def test_find_order_by_cloid_http_error_is_translated(monkeypatch):
         def raise_for_status(self) -> None:
             raise requests.HTTPError("500")
 
-        def json(self) -> dict:  # pragma: no cover
-            return {}
+        content = b"{}"  # never reached
 
     monkeypatch.setattr(
-        "hypertrade.routes.hyperliquid_execution_client.requests.post",
+        "hypertrade.routes.hyperliquid_data_client._SESSION.post",
         lambda *a, **k: _Resp(),
     )
 
@@ -219,11 +222,12 @@ def test_find_order_by_cloid_cancelled_returns_none(monkeypatch):
         def raise_for_status(self) -> None:
             return None
 
-        def json(self) -> dict:
-            return cancelled
+        @property
+        def content(self) -> bytes:
+            return orjson.dumps(cancelled)
 
     monkeypatch.setattr(
-        "hypertrade.routes.hyperliquid_execution_client.requests.post",
+        "hypertrade.routes.hyperliquid_data_client._SESSION.post",
         lambda *a, **k: _Resp(),
     )
     assert client.find_order_by_cloid(_VALID_CLOID, user="0xMASTER") is None
@@ -241,3 +245,29 @@ def test_update_leverage_forwards_is_cross_to_sdk(monkeypatch):
     # SDK signature: update_leverage(leverage, name, is_cross)
     passed_is_cross = args[2] if len(args) > 2 else kwargs.get("is_cross")
     assert passed_is_cross is False
+
+
+@pytest.mark.parametrize(
+    "statuses, expected",
+    [
+        ([{"resting": {"oid": 11}}], (11, OrderStatus.RESTING)),
+        ([{"filled": {"oid": 12, "totalSz": "1"}}], (12, OrderStatus.FILLED)),
+        (["waitingForFill", {"filled": {"oid": 13}}], (13, OrderStatus.FILLED)),
+    ],
+)
+def test_extract_oid_and_status(statuses, expected):
+    res = {"response": {"data": {"statuses": statuses}}}
+    assert HyperliquidExecutionClient._extract_oid_and_status(res) == expected
+
+
+@pytest.mark.parametrize(
+    "res",
+    [
+        {"response": {"data": {"statuses": [{"error": "Order has invalid price."}]}}},
+        {"response": {"data": {"statuses": []}}},
+        {"response": "malformed"},
+    ],
+)
+def test_extract_oid_and_status_rejects_as_value_error(res):
+    with pytest.raises(ValueError, match="Failed to parse order response"):
+        HyperliquidExecutionClient._extract_oid_and_status(res)
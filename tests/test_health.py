@@ -20,6 +20,9 @@ def make_app(monkeypatch):
     # Auth is required to build the app; set a secret so the fixture is hermetic
     # regardless of ambient env (the health endpoints don't enforce it).
     monkeypatch.setenv("HYPERTRADE_WEBHOOK_SECRET", "secret")
+    # The probes don't touch the order DB; never create one in the repo root.
+    monkeypatch.setenv("HYPERTRADE_DB_ENABLED", "false")
+    monkeypatch.setenv("HYPERTRADE_IDEMPOTENCY_ENABLED", "false")
 
     # Ensure this repo's package is first on sys.path to avoid name collisions
     repo_root = str(pathlib.Path(__file__).resolve().parents[1])
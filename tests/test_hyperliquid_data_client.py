@@ -8,6 +8,7 @@ from __future__ import annotations
 import pathlib
 import sys
 
+import orjson
 import pytest
 import requests
 
@@ -42,7 +43,7 @@ def test_connection_error_becomes_network_error(monkeypatch):
         raise requests.ConnectionError("connection refused")
 
     monkeypatch.setattr(
-        "hypertrade.routes.hyperliquid_data_client.requests.post", _raise
+        "hypertrade.routes.hyperliquid_data_client._SESSION.post", _raise
     )
 
     with pytest.raises(HyperliquidNetworkError):
@@ -57,11 +58,10 @@ def test_http_error_becomes_api_error(monkeypatch):
         def raise_for_status(self) -> None:
             raise requests.HTTPError("500 Server Error")
 
-        def json(self) -> dict:  # pragma: no cover - never reached
-            return {}
+        content = b"{}"  # never reached
 
     monkeypatch.setattr(
-        "hypertrade.routes.hyperliquid_data_client.requests.post",
+        "hypertrade.routes.hyperliquid_data_client._SESSION.post",
         lambda *_a, **_k: _Resp(),
     )
 
@@ -77,15 +77,55 @@ def test_timeout_on_balance_becomes_network_error(monkeypatch):
         raise requests.Timeout("read timed out")
 
     monkeypatch.setattr(
-        "hypertrade.routes.hyperliquid_data_client.requests.post", _raise
+        "hypertrade.routes.hyperliquid_data_client._SESSION.post", _raise
     )
 
     with pytest.raises(HyperliquidNetworkError):
         client.get_available_balance("0xM")
 
 
+def test_malformed_body_becomes_network_error(monkeypatch):
+    """An unparseable 200 body stays a retryable HyperliquidNetworkError, as it
+    was when decoding went through ``resp.json()``."""
+    client = _client(monkeypatch)
+
+    class _Resp:
+        content = b"<html>bad gateway</html>"
+
+        def raise_for_status(self) -> None:
+            return None
+
+    monkeypatch.setattr(
+        "hypertrade.routes.hyperliquid_data_client._SESSION.post",
+        lambda *_a, **_k: _Resp(),
+    )
+
+    with pytest.raises(HyperliquidNetworkError):
+        client.get_all_mids()
+
+
+def test_shared_session_never_stores_cookies():
+    """The pooled session is shared across to_thread workers, so a Set-Cookie on
+    one /info response must not leak into the jar used by every other request."""
+    from email.message import Message
+    from types import SimpleNamespace
+
+    from requests.cookies import extract_cookies_to_jar
+
+    from hypertrade.routes.hyperliquid_data_client import _SESSION
+
+    headers = Message()
+    headers["Set-Cookie"] = "sid=abc; Path=/"
+    resp = SimpleNamespace(_original_response=SimpleNamespace(msg=headers))
+    req = requests.Request("POST", "https://api.hyperliquid.xyz/info").prepare()
+
+    extract_cookies_to_jar(_SESSION.cookies, req, resp)
+
+    assert len(_SESSION.cookies) == 0
+
+
 class _CountingPost:
-    """Fake `requests.post` that counts metaAndAssetCtxs POSTs and returns a
+    """Fake `_SESSION.post` that counts metaAndAssetCtxs POSTs and returns a
     realistic meta/asset-ctx payload.
     """
 
@@ -100,11 +140,10 @@ class _CountingPost:
             def raise_for_status(self) -> None:
                 return None
 
-            def json(self) -> list:
-                return [
-                    {"universe": [{"name": "BTC", "szDecimals": 3, "maxLeverage": 50}]},
-                    [{"impactPxs": ["100", "101"], "midPx": "100.5", "markPx": "100.4"}],
-                ]
+            content = orjson.dumps([
+                {"universe": [{"name": "BTC", "szDecimals": 3, "maxLeverage": 50}]},
+                [{"impactPxs": ["100", "101"], "midPx": "100.5", "markPx": "100.4"}],
+            ])
 
         return _Resp()
 
@@ -117,7 +156,7 @@ def test_get_impact_prices_buy_is_ask_sell_is_bid(monkeypatch):
     assets (the xyz:KR200 one-leg incident). _CountingPost ctx has impactPxs=[100,101]."""
     fake_post = _CountingPost()
     monkeypatch.setattr(
-        "hypertrade.routes.hyperliquid_data_client.requests.post", fake_post
+        "hypertrade.routes.hyperliquid_data_client._SESSION.post", fake_post
     )
     client = _client(monkeypatch)
     buy_impact, sell_impact = client.get_impact_prices("BTC")
@@ -129,7 +168,7 @@ def test_meta_fetch_memoized_per_instance(monkeypatch):
     """Multiple meta/ctx getters on ONE instance trigger a single network fetch."""
     fake_post = _CountingPost()
     monkeypatch.setattr(
-        "hypertrade.routes.hyperliquid_data_client.requests.post", fake_post
+        "hypertrade.routes.hyperliquid_data_client._SESSION.post", fake_post
     )
 
     client = _client(monkeypatch)
@@ -140,11 +179,27 @@ def test_meta_fetch_memoized_per_instance(monkeypatch):
     assert fake_post.meta_calls == 1
 
 
+def test_symbol_index_built_once_per_dex_snapshot(monkeypatch):
+    """The name -> position map is built with the memoized snapshot and reused."""
+    fake_post = _CountingPost()
+    monkeypatch.setattr(
+        "hypertrade.routes.hyperliquid_data_client._SESSION.post", fake_post
+    )
+
+    client = _client(monkeypatch)
+    client.get_meta("BTC")
+    index = client._symbol_index[""]
+    client.get_mid("BTC")
+
+    assert index == {"BTC": 0}
+    assert client._symbol_index[""] is index
+
+
 def test_meta_memo_is_per_instance_not_global(monkeypatch):
     """A fresh instance re-fetches; the memo does not leak across instances."""
     fake_post = _CountingPost()
     monkeypatch.setattr(
-        "hypertrade.routes.hyperliquid_data_client.requests.post", fake_post
+        "hypertrade.routes.hyperliquid_data_client._SESSION.post", fake_post
     )
 
     first = _client(monkeypatch)
@@ -192,7 +247,7 @@ def test_get_meta_unknown_symbol_raises_validation_error(monkeypatch):
     (the path place_order() takes before trading)."""
     fake_post = _CountingPost()
     monkeypatch.setattr(
-        "hypertrade.routes.hyperliquid_data_client.requests.post", fake_post
+        "hypertrade.routes.hyperliquid_data_client._SESSION.post", fake_post
     )
     client = _client(monkeypatch)
     with pytest.raises(HyperliquidValidationError):
@@ -229,12 +284,11 @@ def test_get_meta_is_dex_aware(monkeypatch):
             def raise_for_status(self) -> None:
                 return None
 
-            def json(self) -> list:
-                return [{"universe": uni}, [{} for _ in uni]]
+            content = orjson.dumps([{"universe": uni}, [{} for _ in uni]])
 
         return _Resp()
 
-    monkeypatch.setattr("hypertrade.routes.hyperliquid_data_client.requests.post", _post)
+    monkeypatch.setattr("hypertrade.routes.hyperliquid_data_client._SESSION.post", _post)
     client = _client(monkeypatch)
 
     assert client.get_meta("xyz:EWJ")["szDecimals"] == 3      # from the xyz dex universe
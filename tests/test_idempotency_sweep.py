@@ -57,8 +57,9 @@ def test_sweep_removes_old_completed_keeps_recent_and_in_progress(tmp_path, monk
     # Force a deterministic retention window.
     from hypertrade.config import get_settings
 
-    settings = get_settings()
-    monkeypatch.setattr(settings, "idempotency_retention_seconds", retention, raising=False)
+    # Settings is frozen, so swap in a copy carrying the test retention window.
+    settings = get_settings().model_copy(update={"idempotency_retention_seconds": retention})
+    monkeypatch.setattr("hypertrade.idempotency.get_settings", lambda: settings)
 
     # Old completed: completed_at well past the retention window -> must be swept.
     _insert(
@@ -100,8 +101,9 @@ def test_reserve_triggers_sweep(tmp_path, monkeypatch):
 
     from hypertrade.config import get_settings
 
-    settings = get_settings()
-    monkeypatch.setattr(settings, "idempotency_retention_seconds", retention, raising=False)
+    # Settings is frozen, so swap in a copy carrying the test retention window.
+    settings = get_settings().model_copy(update={"idempotency_retention_seconds": retention})
+    monkeypatch.setattr("hypertrade.idempotency.get_settings", lambda: settings)
 
     _insert(
         store,
@@ -0,0 +1,41 @@
+"""Tests for LoggingMiddleware's access log."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+
+REPO_ROOT = str(pathlib.Path(__file__).resolve().parents[1])
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from hypertrade.middleware.logging import LoggingMiddleware
+
+
+def test_access_log_samples_successes_but_keeps_errors(caplog):
+    """With sample_every=3 only every third 2xx line is logged; 4xx/5xx always are."""
+    app = FastAPI()
+
+    @app.get("/ok")
+    def ok():
+        return {"ok": True}
+
+    @app.get("/bad")
+    def bad():
+        raise HTTPException(status_code=400)
+
+    app.add_middleware(LoggingMiddleware, sample_every=3)
+    client = TestClient(app)
+
+    with caplog.at_level("INFO", logger="uvicorn.error"):
+        for _ in range(6):
+            client.get("/ok")
+        client.get("/bad")
+        client.get("/bad")
+
+    lines = [r.getMessage() for r in caplog.records if " -> " in r.getMessage()]
+    assert sum("/ok -> 200" in line for line in lines) == 2
+    assert sum("/bad -> 400" in line for line in lines) == 2
@@ -0,0 +1,57 @@
+"""Tests for the startup log queue — start_log_queue moves uvicorn's handlers
+behind a QueueListener and stop_log_queue drains it and puts them back."""
+
+from __future__ import annotations
+
+import logging
+import pathlib
+import sys
+
+REPO_ROOT = str(pathlib.Path(__file__).resolve().parents[1])
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from hypertrade.logging import start_log_queue, stop_log_queue
+
+
+def test_log_queue_defers_to_original_handlers_and_restores_them():
+    """Records pass through the queue unformatted (args intact) and handlers come back."""
+    seen = []
+
+    class _Capture(logging.Handler):
+        def emit(self, record):
+            seen.append((record.msg, record.args))
+
+    logger = logging.getLogger("uvicorn.access")
+    handler = _Capture()
+    original = logger.handlers[:]
+    logger.handlers = [handler]
+    try:
+        listeners = start_log_queue()
+        assert handler not in logger.handlers
+        logger.warning('%s - "%s %s"', "1.2.3.4", "GET", "/health")
+        stop_log_queue(listeners)
+        assert logger.handlers == [handler]
+    finally:
+        logger.handlers = original
+
+    assert seen == [('%s - "%s %s"', ("1.2.3.4", "GET", "/health"))]
+
+
+def test_log_queue_start_is_idempotent():
+    """A second start while queued must not wrap the queue handler in another queue."""
+    logger = logging.getLogger("uvicorn.access")
+    handler = logging.NullHandler()
+    original = logger.handlers[:]
+    logger.handlers = [handler]
+    try:
+        listeners = start_log_queue()
+        queued = logger.handlers[:]
+        again = start_log_queue()
+        assert all(name != "uvicorn.access" for name, _ in again)
+        assert logger.handlers == queued
+        stop_log_queue(again)
+        stop_log_queue(listeners)
+        assert logger.handlers == [handler]
+    finally:
+        logger.handlers = original
@@ -0,0 +1,106 @@
+"""Token-bucket behaviour of the per-IP rate limiter."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+REPO_ROOT = str(pathlib.Path(__file__).resolve().parents[1])
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from hypertrade.middleware.rate_limit import RateLimitMiddleware
+
+
+def _limiter(max_requests: int = 2, window_seconds: int = 10, burst: int = 1) -> RateLimitMiddleware:
+    return RateLimitMiddleware(
+        FastAPI(), max_requests=max_requests, window_seconds=window_seconds, burst=burst
+    )
+
+
+def test_bucket_spends_capacity_then_refills_at_rate() -> None:
+    limiter = _limiter()  # capacity 3, refill 0.2 tokens/s
+
+    assert [limiter._allow("1.2.3.4", 100.0)[:2] for _ in range(3)] == [
+        (True, 2), (True, 1), (True, 0)
+    ]
+    allowed, remaining, reset_in = limiter._allow("1.2.3.4", 100.0)
+    assert (allowed, remaining) == (False, 0)
+    assert reset_in == 5.0  # one token at 0.2/s
+
+    # Another IP has its own bucket.
+    assert limiter._allow("5.6.7.8", 100.0)[0] is True
+
+    # One token back after 5s, never more than capacity after a long idle.
+    assert limiter._allow("1.2.3.4", 105.0)[0] is True
+    assert limiter._allow("1.2.3.4", 105.0)[0] is False
+    assert limiter._allow("1.2.3.4", 10_000.0)[:2] == (True, 2)
+    assert limiter._buckets["1.2.3.4"] == (2.0, 10_000.0)
+
+
+def test_denied_request_gets_429_with_rounded_up_retry_after() -> None:
+    app = FastAPI()
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    app.add_middleware(RateLimitMiddleware, max_requests=1, window_seconds=3, burst=0)
+    client = TestClient(app)
+
+    first = client.get("/ping")
+    assert first.status_code == 200
+    assert first.headers["X-RateLimit-Remaining"] == "0"
+
+    second = client.get("/ping")
+    assert second.status_code == 429
+    assert int(second.headers["Retry-After"]) >= 1
+    assert second.headers["X-RateLimit-Limit"] == "1"
+    assert second.headers["X-RateLimit-Remaining"] == "0"
+    assert second.headers["content-type"] == "application/json"
+    assert second.json() == {"error": {"status": 429, "detail": "Too Many Requests"}}
+
+
+def test_idle_buckets_are_swept_once_full_again() -> None:
+    limiter = _limiter()  # capacity 3, refill 0.2 tokens/s -> full after 15s idle
+
+    limiter._allow("1.2.3.4", 100.0)
+    limiter._allow("5.6.7.8", 105.0)
+    assert set(limiter._buckets) == {"1.2.3.4", "5.6.7.8"}
+
+    # Next sweep (one window later): 1.2.3.4 idle 16s is dropped, 5.6.7.8 kept.
+    limiter._allow("9.9.9.9", 116.0)
+    assert set(limiter._buckets) == {"5.6.7.8", "9.9.9.9"}
+
+    # A dropped IP starts again from a full bucket, exactly as if it were kept.
+    assert limiter._allow("1.2.3.4", 116.0)[:2] == (True, 2)
+
+
+def test_excluded_path_bypasses_limit_and_others_do_not() -> None:
+    app = FastAPI()
+
+    @app.get("/health")
+    def health():
+        return {"ok": True}
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    app.add_middleware(
+        RateLimitMiddleware, max_requests=1, window_seconds=60, exclude_paths=["/health"]
+    )
+    client = TestClient(app)
+
+    assert [client.get("/health").status_code for _ in range(3)] == [200, 200, 200]
+    assert [client.get("/ping").status_code for _ in range(2)] == [200, 429]
+
+
+@pytest.mark.parametrize("max_requests, window_seconds", [(0, 10), (5, 0)])
+def test_zero_limit_or_window_rejected_by_middleware(max_requests, window_seconds) -> None:
+    with pytest.raises(ValueError):
+        _limiter(max_requests=max_requests, window_seconds=window_seconds)
@@ -74,3 +74,29 @@ def test_trust_forwarded_for_defaults_to_false(monkeypatch) -> None:
     monkeypatch.delenv("HYPERTRADE_TRUST_FORWARDED_FOR", raising=False)
 
     assert Settings(_env_file=None).trust_forwarded_for is False
+
+
+async def test_whitelist_dependency_uses_startup_compiled_set() -> None:
+    """The dependency checks the frozenset compiled onto app.state at startup."""
+    from types import SimpleNamespace
+
+    import pytest
+    from fastapi import HTTPException
+
+    from hypertrade.security import require_ip_whitelisted
+
+    settings = SimpleNamespace(
+        ip_whitelist_enabled=True, tv_webhook_ips=["198.51.100.1"], trust_forwarded_for=False
+    )
+    req = _FakeRequest(peer="203.0.113.9")
+    req.app = SimpleNamespace(
+        state=SimpleNamespace(settings=settings, tv_webhook_ips=frozenset({"203.0.113.9"}))
+    )
+    dependency = require_ip_whitelisted(None)
+
+    await dependency(req)  # allowed via app.state
+
+    req.app.state.tv_webhook_ips = frozenset({"198.51.100.1"})
+    with pytest.raises(HTTPException) as exc_info:
+        await dependency(req)
+    assert exc_info.value.status_code == 403
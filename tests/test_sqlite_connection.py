@@ -62,3 +62,22 @@ def test_concurrent_reserve_complete_no_lock(tmp_path):
         t.join()
 
     assert not errors, f"concurrent access raised: {errors!r}"
+
+
+def test_order_database_reuses_one_tuned_connection(tmp_path):
+    """OrderDatabase keeps one WAL connection with synchronous=NORMAL across calls."""
+    from hypertrade.database import OrderDatabase
+
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    try:
+        with db._connection() as conn:
+            first = conn
+            synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        db.log_failure(request_id="r1", error_type="Net", error_message="boom")
+        with db._connection() as conn:
+            assert conn is first
+    finally:
+        db.close()
+    assert synchronous == 1  # NORMAL
+    assert str(mode).lower() == "wal"
@@ -16,10 +16,20 @@ import copy
 
 from decimal import Decimal
 
+import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch
 
 
+@pytest.fixture(autouse=True)
+def _isolated_db_path(monkeypatch, tmp_path):
+    """Keep every test app's SQLite file out of the repo root.
+
+    Tests that need a specific file still override HYPERTRADE_DB_PATH themselves.
+    """
+    monkeypatch.setenv("HYPERTRADE_DB_PATH", str(tmp_path / "hypertrade_test.db"))
+
+
 BASE_PAYLOAD = {
     "general": {
         "strategy": "Solana Super Cool Enhanced Strategy (114, 21, 1, 2, 0)",
@@ -831,6 +841,13 @@ def test_history_requires_bearer_auth(monkeypatch):
     assert client.get("/history/orders", headers={"Authorization": "Bearer secret"}).status_code == 200
 
 
+def test_history_bearer_with_non_ascii_token_is_401_not_500(monkeypatch):
+    app = make_app(monkeypatch, secret="secret")
+    client = TestClient(app)
+    resp = client.get("/history/orders", headers={"Authorization": "Bearer s\xe9cret".encode("latin-1")})
+    assert resp.status_code == 401
+
+
 # ===================================================================
 # Dry-Run (Demo) Mode
 # ===================================================================
@@ -1017,3 +1034,37 @@ def test_invalid_json_body_log_redacts_secret(monkeypatch, caplog):
     joined = " ".join(body_logs)
     assert "topsecret-xyz" not in joined
     assert "REDACTED" in joined
+
+
+def test_zero_max_payload_bytes_disables_content_limit(monkeypatch):
+    """HYPERTRADE_MAX_PAYLOAD_BYTES=0 means no limit: the middleware is not installed
+    (rather than rejecting every non-empty body)."""
+    from hypertrade.middleware.content_limit import ContentLengthLimitMiddleware
+
+    StubHyperliquidService.reset()
+    monkeypatch.setenv("HYPERTRADE_MAX_PAYLOAD_BYTES", "0")
+    app = make_app(monkeypatch, secret="secret")
+    assert all(m.cls is not ContentLengthLimitMiddleware for m in app.user_middleware)
+
+    resp = TestClient(app).post("/webhook", json=copy.deepcopy(BASE_PAYLOAD))
+    assert resp.status_code == 200, resp.text
+
+
+def test_oversized_content_length_returns_413(monkeypatch):
+    """A body over HYPERTRADE_MAX_PAYLOAD_BYTES is answered 413 (not a 500) before routing."""
+    StubHyperliquidService.reset()
+    monkeypatch.setenv("HYPERTRADE_MAX_PAYLOAD_BYTES", "64")
+    app = make_app(monkeypatch, secret="secret")
+
+    resp = TestClient(app).post("/webhook", json=copy.deepcopy(BASE_PAYLOAD))
+    assert resp.status_code == 413, resp.text
+    assert resp.headers["content-type"] == "application/json"
+    assert resp.json() == {
+        "error": {
+            "status": 413,
+            "detail": "Payload too large",
+            "path": "/webhook",
+            "request_id": None,
+        }
+    }
+    assert StubHyperliquidService.call_count == 0